@@ -32,6 +32,7 @@ class Settings(BaseSettings):
     # Scheduler / Job Collection Configuration
     job_collection_schedule: str = "0 2 * * *"
     max_jobs_per_search: int = 100
+    max_concurrent_pages: int = 5
     job_data_retention_days: int = 90
     job_collection_roles: List[str] | None = None
     job_collection_locations: List[str] | None = None
@@ -61,6 +62,7 @@ class Settings(BaseSettings):
         "their_stack_max_retries",
         "their_stack_rate_limit",
         "max_jobs_per_search",
+        "max_concurrent_pages",
         "job_data_retention_days",
         mode="before",
     )
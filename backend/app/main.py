@@ -105,7 +105,9 @@ async def startup_event():
         logger.info("Connected to MongoDB")
 
         job_collection_service = JobCollectionService()
-        scheduler = SchedulerService(
+        # Shared instance: repeated startup events (e.g. uvicorn --reload)
+        # reuse the same scheduler instead of spawning another one
+        scheduler = SchedulerService.get(
             roles=POPULAR_ROLES,
             locations=POPULAR_LOCATIONS,
             collection_service=job_collection_service,
@@ -4,6 +4,8 @@ from beanie import Document, Indexed
 from pydantic import Field
 from pymongo import IndexModel, ASCENDING, DESCENDING
 
+from app.core.config import settings
+
 
 class JobPosting(Document):
     """JobPosting document model for storing scraped job data."""
@@ -11,12 +13,14 @@ class JobPosting(Document):
     title: str = Field(..., description="Job title")
     company: str = Field(..., description="Company name")
     location: str = Field(..., description="Job location")
+    location_lc: Optional[str] = Field(default=None, description="Lowercased location for indexed filtering")
     description: str = Field(..., description="Full job description text")
     skills: List[str] = Field(default_factory=list, description="Extracted skills from job description")
     url: Indexed(str, unique=True) = Field(..., description="Original job URL")
     search_keywords: str = Field(..., description="Search terms used to find this job")
+    search_keywords_lc: Optional[str] = Field(default=None, description="Lowercased search keywords for indexed filtering")
     search_location: str = Field(..., description="Location searched")
-    scraped_at: Indexed(datetime) = Field(default_factory=datetime.utcnow, description="When the job was scraped")
+    scraped_at: datetime = Field(default_factory=datetime.utcnow, description="When the job was scraped")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
     job_id: Optional[str] = Field(default=None, description="Unique TheirStack job identifier")
     date_posted: Optional[datetime] = Field(default=None, description="Original job posting date")
@@ -32,13 +36,23 @@ class JobPosting(Document):
         indexes = [
             IndexModel([("url", ASCENDING)], unique=True),
             IndexModel([("job_id", ASCENDING)], unique=True, sparse=True),
-            IndexModel([("scraped_at", ASCENDING)]),
+            # TTL index: Mongo's background expiry continuously drops
+            # postings past the retention window, so the scheduled cleanup
+            # only has to mop up after configuration changes
+            IndexModel(
+                [("scraped_at", ASCENDING)],
+                expireAfterSeconds=settings.job_data_retention_days * 86400,
+            ),
             IndexModel([("date_posted", DESCENDING)], sparse=True),
             IndexModel([("skills", ASCENDING)]),
             IndexModel([("technology_slugs", ASCENDING)], sparse=True),
             IndexModel([("search_keywords", ASCENDING), ("search_location", ASCENDING)]),
+            # Covers the per-role freshness probe (search_keywords + recency)
+            IndexModel([("search_keywords", ASCENDING), ("scraped_at", DESCENDING)]),
             IndexModel([("company", ASCENDING)]),
             IndexModel([("location", ASCENDING)]),
+            IndexModel([("location_lc", ASCENDING)], sparse=True),
+            IndexModel([("search_keywords_lc", ASCENDING)], sparse=True),
             IndexModel([("remote", ASCENDING)], sparse=True),
             IndexModel([("min_annual_salary_usd", ASCENDING)], sparse=True),
             IndexModel([("max_annual_salary_usd", ASCENDING)], sparse=True),
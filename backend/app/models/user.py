@@ -21,6 +21,10 @@ class User(Document):
         indexes = [
             IndexModel([("email", 1)], unique=True),
             IndexModel([("created_at", -1)]),
+            # Multikey index backing the target-role union aggregation
+            IndexModel([("target_roles", 1)]),
+            # Backs the experience-level migration and distribution queries
+            IndexModel([("experience_level", 1)], sparse=True),
         ]
     
     def update_timestamp(self):
@@ -11,7 +11,7 @@ from app.schemas.learning import (
 from app.services.project_service import (
     get_project_recommendations, search_projects, get_all_projects,
     get_skill_building_projects, load_project_ideas, calculate_skill_match,
-    DIFFICULTIES
+    normalize_user_skills, DIFFICULTIES
 )
 
 router = APIRouter()
@@ -108,11 +108,11 @@ async def get_skill_building_project_recommendations(
                 detail=f"Invalid difficulty level. Must be one of: {', '.join(DIFFICULTIES)}"
             )
         
-        # Load all projects
-        all_projects = load_project_ideas()
-        
+        # Load the project catalogue with its precomputed indexes
+        catalog = load_project_ideas()
+
         # Get skill-building projects
-        skill_building_projects_data = get_skill_building_projects(skills, all_projects)
+        skill_building_projects_data = get_skill_building_projects(skills, catalog)
         
         # Filter by difficulty if specified
         if difficulty:
@@ -122,15 +122,17 @@ async def get_skill_building_project_recommendations(
             ]
         
         # Calculate skill matches for the user
-        user_skills = current_user.skills or []
+        user_skills_set = normalize_user_skills(current_user.skills or [])
         projects_with_matches = []
-        
+
         for project_data in skill_building_projects_data[:limit]:
             match_percentage, missing_skills = calculate_skill_match(
-                user_skills, project_data.get("skills", [])
+                user_skills_set, project_data.get("skills", [])
             )
             
-            project = ProjectIdea(
+            # Catalogue data is validated when loaded, so skip per-request
+            # Pydantic validation here
+            project = ProjectIdea.model_construct(
                 **project_data,
                 skill_match_percentage=match_percentage,
                 missing_skills=missing_skills
@@ -271,18 +273,24 @@ async def get_all_project_ideas(
         )
         
         # Calculate skill matches for the user
-        user_skills = current_user.skills or []
+        user_skills_set = normalize_user_skills(current_user.skills or [])
         projects_with_matches = []
-        
+
         for project in projects:
             match_percentage, missing_skills = calculate_skill_match(
-                user_skills, project.skills
+                user_skills_set, project.skills
+            )
+
+            # Copy with match information; the returned instances are shared
+            # cached models and must not be mutated in place
+            projects_with_matches.append(
+                project.model_copy(
+                    update={
+                        "skill_match_percentage": match_percentage,
+                        "missing_skills": missing_skills,
+                    }
+                )
             )
-            
-            # Update project with match information
-            project.skill_match_percentage = match_percentage
-            project.missing_skills = missing_skills
-            projects_with_matches.append(project)
         
         logger.info(f"Retrieved {len(projects_with_matches)} projects (total: {total_count}) for user {current_user.email}")
         return projects_with_matches
@@ -2,6 +2,9 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
 from app.core.config import settings
 from app.models.job_posting import JobPosting
 from app.services.skill_extractor import skill_extractor
@@ -14,6 +17,16 @@ from app.services.theirstack_client import (
 logger = logging.getLogger(__name__)
 
 
+def canonicalize_role(role: str) -> str:
+    """Normalize a role string for dedup and indexed lookups.
+
+    Lowercases, strips, and collapses internal whitespace so that
+    "Software Engineer", "software engineer", and "Software  Engineer"
+    all map to the same key.
+    """
+    return " ".join(role.strip().lower().split())
+
+
 class JobCollectionService:
     """Service responsible for collecting job postings from TheirStack."""
 
@@ -228,6 +241,10 @@ class JobCollectionService:
             total_pages = 0
             total_credits_used = 0
             page = 1
+            # Keys already written this run: role variations and overlapping
+            # pages return the same postings repeatedly, and dropping them
+            # here saves a wasted upsert per duplicate
+            seen_keys: set = set()
             per_page_limit = max(1, min(settings.max_jobs_per_search, per_role_limit))
             logger.info(
                 "Starting TheirStack collection for role '%s' with locations '%s'",
@@ -235,63 +252,68 @@ class JobCollectionService:
                 search_location_label or "(any)",
             )
 
+            # Build the search payload once per role; only page and limit
+            # change between iterations, so the role variations and the
+            # country-code mapping are not recomputed per page
+            
+            # Generate common variations for broader results
+            # "Backend Developer" → ["Backend Developer", "Senior Backend Developer", "Java Backend Developer", etc.]
+            role_variations = self._generate_role_variations(role_label)
+            
+            payload: Dict[str, Any] = {
+                "job_title_or": role_variations,  # Search multiple variations at once
+                "posted_at_max_age_days": max_age_days,
+            }
+
+            if normalized_locations:
+                payload["job_location_pattern_or"] = normalized_locations
+                
+                # Add country codes for better matching
+                country_codes = []
+                for loc in normalized_locations:
+                    loc_lower = loc.lower()
+                    if "united states" in loc_lower:
+                        country_codes.append("US")
+                    elif "india" in loc_lower:
+                        country_codes.append("IN")
+                    elif "united kingdom" in loc_lower or "uk" in loc_lower:
+                        country_codes.append("GB")
+                    elif "canada" in loc_lower:
+                        country_codes.append("CA")
+                    elif "germany" in loc_lower:
+                        country_codes.append("DE")
+                    elif "australia" in loc_lower:
+                        country_codes.append("AU")
+                    elif "singapore" in loc_lower:
+                        country_codes.append("SG")
+                    elif "japan" in loc_lower:
+                        country_codes.append("JP")
+                    elif "hong kong" in loc_lower:
+                        country_codes.append("HK")
+                    elif "switzerland" in loc_lower:
+                        country_codes.append("CH")
+                    elif "france" in loc_lower:
+                        country_codes.append("FR")
+                    elif "netherlands" in loc_lower:
+                        country_codes.append("NL")
+                    elif "ireland" in loc_lower:
+                        country_codes.append("IE")
+                    elif "sweden" in loc_lower:
+                        country_codes.append("SE")
+                
+                if country_codes:
+                    payload["job_country_code_or"] = country_codes
+
             while total_collected < per_role_limit:
                 remaining = per_role_limit - total_collected
                 page_limit = max(1, min(per_page_limit, remaining))
-                
-                # Generate common variations for broader results
-                # "Backend Developer" → ["Backend Developer", "Senior Backend Developer", "Java Backend Developer", etc.]
-                role_variations = self._generate_role_variations(role_label)
-                
-                payload: Dict[str, Any] = {
-                    "job_title_or": role_variations,  # Search multiple variations at once
-                    "posted_at_max_age_days": max_age_days,
-                    "page": page,
-                    "limit": page_limit,
-                }
-
-                if normalized_locations:
-                    payload["job_location_pattern_or"] = normalized_locations
-                    
-                    # Add country codes for better matching
-                    country_codes = []
-                    for loc in normalized_locations:
-                        loc_lower = loc.lower()
-                        if "united states" in loc_lower:
-                            country_codes.append("US")
-                        elif "india" in loc_lower:
-                            country_codes.append("IN")
-                        elif "united kingdom" in loc_lower or "uk" in loc_lower:
-                            country_codes.append("GB")
-                        elif "canada" in loc_lower:
-                            country_codes.append("CA")
-                        elif "germany" in loc_lower:
-                            country_codes.append("DE")
-                        elif "australia" in loc_lower:
-                            country_codes.append("AU")
-                        elif "singapore" in loc_lower:
-                            country_codes.append("SG")
-                        elif "japan" in loc_lower:
-                            country_codes.append("JP")
-                        elif "hong kong" in loc_lower:
-                            country_codes.append("HK")
-                        elif "switzerland" in loc_lower:
-                            country_codes.append("CH")
-                        elif "france" in loc_lower:
-                            country_codes.append("FR")
-                        elif "netherlands" in loc_lower:
-                            country_codes.append("NL")
-                        elif "ireland" in loc_lower:
-                            country_codes.append("IE")
-                        elif "sweden" in loc_lower:
-                            country_codes.append("SE")
-                    
-                    if country_codes:
-                        payload["job_country_code_or"] = country_codes
+                payload["page"] = page
+                payload["limit"] = page_limit
 
                 # Debug: Log the actual payload being sent with variations
-                logger.info(f"Sending TheirStack search for '{role_label}' with {len(role_variations)} variations")
-                logger.info(f"Payload: {payload}")
+                logger.info("Sending TheirStack search for '%s' with %s variations", role_label, len(role_variations))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Payload: %s", payload)
 
                 try:
                     response = await self.client.search_jobs(payload)
@@ -325,6 +347,11 @@ class JobCollectionService:
                 )
                 total_credits_used += credits_used or estimated_credits
 
+                # Map the page into bulk upsert operations, then write the
+                # whole page in one unordered bulk_write instead of a
+                # find/save round-trip per job
+                page_ops: List[UpdateOne] = []
+                updated_at = datetime.utcnow()
                 for job in data:
                     job_title = job.get("job_title") or job.get("title")
                     if self._should_skip_job(role_label, job_title):
@@ -334,15 +361,56 @@ class JobCollectionService:
                     if mapped is None:
                         continue
 
-                    try:
-                        await JobPosting.upsert_job(mapped)
-                        total_collected += 1
-                    except Exception as exc:  # pragma: no cover - defensive
-                        logger.exception("Failed to upsert job '%s': %s", mapped.get("job_id") or mapped.get("url"), exc)
+                    dedupe_key = mapped.get("job_id") or mapped["url"]
+                    if dedupe_key in seen_keys:
+                        continue
+                    seen_keys.add(dedupe_key)
+
+                    # Match either identifier, like upsert_job's job_id-then-
+                    # url fallback: a legacy document stored without job_id
+                    # must update on url instead of colliding with the unique
+                    # url index on insert. $set/$setOnInsert supply every
+                    # field, so upserting through an $or filter is safe
+                    job_id_value = mapped.get("job_id")
+                    url_value = mapped.get("url")
+                    if job_id_value and url_value:
+                        key = {"$or": [{"job_id": job_id_value}, {"url": url_value}]}
+                    elif job_id_value:
+                        key = {"job_id": job_id_value}
+                    else:
+                        key = {"url": url_value}
+                    # Mirror upsert_job semantics: refresh every field on a
+                    # re-scrape except scraped_at, which keeps its original
+                    # insert-time value
+                    update_doc = {k: v for k, v in mapped.items() if k != "scraped_at"}
+                    update_doc["updated_at"] = updated_at
+                    page_ops.append(
+                        UpdateOne(
+                            key,
+                            {"$set": update_doc, "$setOnInsert": {"scraped_at": mapped["scraped_at"]}},
+                            upsert=True,
+                        )
+                    )
 
-                    if total_collected >= per_role_limit:
+                    if total_collected + len(page_ops) >= per_role_limit:
                         break
 
+                if page_ops:
+                    try:
+                        await JobPosting.get_motor_collection().bulk_write(page_ops, ordered=False)
+                        total_collected += len(page_ops)
+                    except BulkWriteError as exc:
+                        succeeded = exc.details.get("nMatched", 0) + exc.details.get("nUpserted", 0)
+                        total_collected += succeeded
+                        logger.warning(
+                            "Bulk upsert for role '%s' page %s completed partially: %s",
+                            role_label,
+                            page,
+                            exc.details.get("writeErrors"),
+                        )
+                    except Exception:  # pragma: no cover - defensive
+                        logger.exception("Bulk upsert failed for role '%s' page %s", role_label, page)
+
                 has_more = metadata.get("has_more")
                 total_results = metadata.get("total_results") or metadata.get("total")
                 logger.info(
@@ -473,12 +541,16 @@ class JobCollectionService:
         job_id_raw = job.get("job_id") or job.get("id")
         job_id_str = str(job_id_raw) if job_id_raw is not None else None
         
+        location_value = location_label or job.get("location", "Unknown")
+        canonical_role = canonicalize_role(role)
+
         mapped_job = {
             "job_id": job_id_str,
             "title": job.get("job_title") or job.get("title") or role,
             "company": company_obj.get("name") or job.get("company") or "Unknown Company",
             "company_domain": company_obj.get("domain") or job.get("company_domain"),
-            "location": location_label or job.get("location", "Unknown"),
+            "location": location_value,
+            "location_lc": location_value.lower(),
             "description": description,
             "skills": skills,
             "url": job.get("job_url") or job.get("url") or job.get("detail_url"),
@@ -487,7 +559,8 @@ class JobCollectionService:
             "max_annual_salary_usd": job.get("max_annual_salary_usd") or job.get("salary_max_annual_usd"),
             "remote": job.get("remote"),
             "technology_slugs": technology_slugs,
-            "search_keywords": role,
+            "search_keywords": canonical_role,
+            "search_keywords_lc": canonical_role,
             "search_location": search_location_label,
             "coordinates": coordinates,
             "scraped_at": datetime.utcnow(),
@@ -1,22 +1,25 @@
 import json
 import logging
+from functools import lru_cache
+from itertools import chain
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
-from cachetools import TTLCache
-import re
-from difflib import SequenceMatcher
+from rapidfuzz import fuzz, process
 
 from app.models.user import User
 from app.schemas.learning import (
     LearningResource, SkillLearningPath, LearningRoadmapResponse,
     ResourceSearchResponse, ResourceType
 )
-from app.services.gap_service import analyze_skill_gap
 
-# Cache for 1 hour to improve performance
-cache = TTLCache(maxsize=100, ttl=3600)
 logger = logging.getLogger(__name__)
 
+# The resources file is static, so the parsed data is kept for the life of
+# the process and only re-read if the file changes on disk. Under multiple
+# Uvicorn workers each process pays the parse cost exactly once instead of
+# once per TTL expiry.
+_resources_cache: Optional[Tuple[float, Dict[str, List[Dict]]]] = None
+
 # Constants for validation
 RESOURCE_TYPES = {"Documentation", "Video", "Course", "Book"}
 
@@ -31,22 +34,23 @@ def load_learning_resources() -> Dict[str, List[Dict]]:
     Raises:
         HTTPException: If file cannot be loaded
     """
-    cache_key = "learning_resources"
-    if cache_key in cache:
-        logger.info("Returning cached learning resources")
-        return cache[cache_key]
-    
+    global _resources_cache
+
     try:
         # Path to the learning resources JSON file
         resources_path = Path(__file__).parent.parent.parent / "learning_resources.json"
-        
+
+        mtime = resources_path.stat().st_mtime
+        if _resources_cache is not None and _resources_cache[0] == mtime:
+            return _resources_cache[1]
+
         with open(resources_path, 'r', encoding='utf-8') as file:
             resources_data = json.load(file)
-        
-        # Cache the loaded data
-        cache[cache_key] = resources_data
+
+        # Cache the loaded data keyed on file mtime
+        _resources_cache = (mtime, resources_data)
         logger.info(f"Loaded learning resources for {len(resources_data)} skills")
-        
+
         return resources_data
         
     except FileNotFoundError:
@@ -60,13 +64,17 @@ def load_learning_resources() -> Dict[str, List[Dict]]:
         raise Exception("Failed to load learning resources")
 
 
+@lru_cache(maxsize=4096)
 def normalize_skill_name(skill: str) -> str:
     """
     Normalize skill name for consistent matching.
-    
+
+    Memoized since the same skill names are normalized repeatedly across
+    requests (resource keys, user skills, and gap-analysis skills overlap).
+
     Args:
         skill: Raw skill name
-        
+
     Returns:
         str: Normalized skill name (lowercase, stripped)
     """
@@ -85,40 +93,93 @@ def find_skill_resources(skill: str, resources_data: Dict[str, List[Dict]]) -> L
         List[LearningResource]: List of resources for the skill
     """
     normalized_skill = normalize_skill_name(skill)
-    
-    best_match = None
-    best_similarity = 0.0
-    
-    # First pass: look for exact matches while tracking closest partial match
-    for skill_key, resources in resources_data.items():
-        normalized_key = normalize_skill_name(skill_key)
-        if normalized_key == normalized_skill:
-            return [LearningResource(**resource) for resource in resources]
-        
-        # Compute similarity score for partial matches
-        similarity = SequenceMatcher(None, normalized_skill, normalized_key).ratio()
-        if normalized_key.startswith(normalized_skill) or normalized_skill.startswith(normalized_key):
-            similarity = min(1.0, similarity + 0.1)
-        
-        if similarity > best_similarity:
-            best_similarity = similarity
-            best_match = (skill_key, resources)
-    
-    # Use the closest partial match only if it's reasonably similar
-    if best_match and best_similarity >= 0.7:
-        skill_key, resources = best_match
+
+    normalized_keys = {normalize_skill_name(key): key for key in resources_data}
+
+    # Exact match on the normalized key
+    exact_key = normalized_keys.get(normalized_skill)
+    if exact_key is not None:
+        return [LearningResource(**resource) for resource in resources_data[exact_key]]
+
+    # Fuzzy match: WRatio handles prefix/substring containment natively,
+    # so no manual startswith boost is needed
+    match = process.extractOne(
+        normalized_skill,
+        normalized_keys.keys(),
+        scorer=fuzz.WRatio,
+        score_cutoff=70,
+    )
+    if match:
+        matched_key = normalized_keys[match[0]]
         logger.info(
-            "Found closest match for '%s': '%s' (similarity %.2f)",
+            "Found closest match for '%s': '%s' (score %.1f)",
             skill,
-            skill_key,
-            best_similarity,
+            matched_key,
+            match[1],
         )
-        return [LearningResource(**resource) for resource in resources]
+        return [LearningResource(**resource) for resource in resources_data[matched_key]]
 
     logger.warning(f"No resources found for skill: {skill}")
     return []
 
 
+def _find_skill_resources_batch(
+    skills: List[str], resources_data: Dict[str, List[Dict]]
+) -> Dict[str, List[LearningResource]]:
+    """
+    Resolve resources for several skills with one fuzzy-match call.
+
+    Exact matches are resolved directly; the remaining skills are scored
+    against all resource keys in a single rapidfuzz cdist call instead of
+    one scan per skill.
+
+    Args:
+        skills: Skill names to resolve
+        resources_data: Dictionary of all learning resources
+
+    Returns:
+        Dict[str, List[LearningResource]]: Resources keyed by input skill
+    """
+    normalized_keys = {normalize_skill_name(key): key for key in resources_data}
+    key_list = list(normalized_keys)
+
+    resolved: Dict[str, List[LearningResource]] = {}
+    fuzzy_queries: List[Tuple[str, str]] = []
+
+    for skill in skills:
+        normalized_skill = normalize_skill_name(skill)
+        exact_key = normalized_keys.get(normalized_skill)
+        if exact_key is not None:
+            resolved[skill] = [LearningResource(**resource) for resource in resources_data[exact_key]]
+        else:
+            fuzzy_queries.append((skill, normalized_skill))
+
+    if fuzzy_queries:
+        matrix = process.cdist(
+            [normalized for _, normalized in fuzzy_queries],
+            key_list,
+            scorer=fuzz.WRatio,
+            score_cutoff=70,
+            workers=-1,
+        )
+        for row, (skill, _) in zip(matrix, fuzzy_queries):
+            best_index = int(row.argmax())
+            if row[best_index]:
+                matched_key = normalized_keys[key_list[best_index]]
+                logger.info(
+                    "Found closest match for '%s': '%s' (score %.1f)",
+                    skill,
+                    matched_key,
+                    float(row[best_index]),
+                )
+                resolved[skill] = [LearningResource(**resource) for resource in resources_data[matched_key]]
+            else:
+                logger.warning(f"No resources found for skill: {skill}")
+                resolved[skill] = []
+
+    return resolved
+
+
 async def get_learning_roadmap(
     user: User,
     include_gap_analysis: bool = True,
@@ -152,6 +213,10 @@ async def get_learning_roadmap(
         # Get gap analysis if requested and role is available
         gap_analysis = None
         if include_gap_analysis and analysis_role:
+            # Imported lazily: gap_service pulls in the job posting model and
+            # its transitive imports, which the other roadmap paths don't need
+            from app.services.gap_service import analyze_skill_gap
+
             try:
                 # Use 10% threshold to include all skills appearing in at least 10% of jobs
                 gap_analysis = await analyze_skill_gap(user, analysis_role, threshold=0.10)
@@ -197,7 +262,13 @@ async def get_learning_roadmap(
             user_skills = user.skills or []
             common_skills = ["Python", "JavaScript", "React", "Node.js", "MongoDB", "FastAPI"]
             
-            all_skills = set(user_skills + common_skills)
+            # Dedupe on the normalized form to collapse case variants
+            # like "Python" vs "python", without building an intermediate
+            # concatenated list
+            deduped = {normalize_skill_name(s): s for s in user_skills}
+            for s in common_skills:
+                deduped.setdefault(normalize_skill_name(s), s)
+            all_skills = deduped.values()
             for skill in all_skills:
                 skills_to_include.add(skill)
                 
@@ -266,11 +337,12 @@ async def get_resources_for_skills(
     """
     try:
         resources_data = load_learning_resources()
-        all_resources = []
-        
-        for skill in skills:
-            skill_resources = find_skill_resources(skill, resources_data)
-            all_resources.extend(skill_resources)
+        # Collapse duplicate/case-variant skills before the lookup
+        skills = list({normalize_skill_name(s): s for s in skills}.values())
+
+        resolved = _find_skill_resources_batch(skills, resources_data)
+        # One C-level concatenation instead of an extend call per skill
+        all_resources = list(chain.from_iterable(resolved.get(skill, []) for skill in skills))
         
         # Apply resource type filter
         if resource_type and resource_type in RESOURCE_TYPES:
@@ -323,25 +395,25 @@ async def search_resources(
     try:
         resources_data = load_learning_resources()
         all_resources = []
-        query_lower = query.lower()
-        
+
+        # Multi-term queries use AND semantics: every token must appear
+        # somewhere in the skill name or resource content. Per-token
+        # substring tests (str.find) are cheap and, unlike an alternation
+        # findall, stay correct when one token is a substring of another
+        tokens = set(query.lower().split())
+        if not tokens:
+            return [], 0
+
         # Search across all skills and resources
         for skill, resources in resources_data.items():
             skill_lower = skill.lower()
-            
-            # Check if query matches skill name
-            skill_matches = query_lower in skill_lower
-            
+
             for resource_data in resources:
                 resource = LearningResource(**resource_data)
-                
-                # Check if query matches resource content
-                content_matches = (
-                    query_lower in resource.title.lower() or
-                    query_lower in resource.description.lower()
-                )
-                
-                if skill_matches or content_matches:
+
+                # Single combined lowercased haystack per resource
+                haystack = f"{skill_lower}\n{resource.title.lower()}\n{resource.description.lower()}"
+                if all(token in haystack for token in tokens):
                     all_resources.append(resource)
         
         # Apply resource type filter
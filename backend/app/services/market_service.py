@@ -1,8 +1,10 @@
 import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from cachetools import TTLCache
+from pydantic import BaseModel
 
 from app.models.job_posting import JobPosting
 from app.schemas.analytics import (
@@ -20,7 +22,48 @@ cache = TTLCache(maxsize=100, ttl=0)
 logger = logging.getLogger(__name__)
 
 
-async def get_trending_skills(days: int = 30, limit: int = 15) -> List[TrendingSkill]:
+class _TechnologySlugsView(BaseModel):
+    """Projection carrying only the technology slugs of a job posting."""
+
+    technology_slugs: Optional[List[str]] = None
+
+
+def compute_trending_skills_in_memory(jobs: List[_TechnologySlugsView], limit: int = 15) -> List[TrendingSkill]:
+    """
+    Compute trending skills from a list of job postings in pure Python.
+
+    Fallback for when the MongoDB aggregation pipeline is unavailable (and
+    handy for small deployments and tests). Counter's C-level counting keeps
+    this fast enough for in-memory datasets.
+
+    Args:
+        jobs: Job postings (or slug-only projections of them) to analyze
+        limit: Maximum number of skills to return
+
+    Returns:
+        List[TrendingSkill]: Top skills sorted by frequency
+    """
+    if not jobs:
+        return []
+
+    counter = Counter(
+        slug.lower() for job in jobs for slug in (job.technology_slugs or [])
+    )
+    total_jobs = len(jobs)
+
+    return [
+        TrendingSkill(
+            skill=skill,
+            count=count,
+            percentage=round((count / total_jobs) * 100, 2),
+        )
+        for skill, count in counter.most_common(limit)
+    ]
+
+
+async def get_trending_skills(
+    days: int = 30, limit: int = 15, cutoff: Optional[datetime] = None
+) -> List[TrendingSkill]:
     """
     Get trending skills from job postings using ONLY technology_slugs field.
     
@@ -30,6 +73,7 @@ async def get_trending_skills(days: int = 30, limit: int = 15) -> List[TrendingS
     Args:
         days: Number of days to look back for analysis
         limit: Maximum number of skills to return
+        cutoff: Precomputed cutoff datetime (overrides days when provided)
         
     Returns:
         List[TrendingSkill]: Top skills sorted by frequency
@@ -40,7 +84,7 @@ async def get_trending_skills(days: int = 30, limit: int = 15) -> List[TrendingS
         return cache[cache_key]
     
     try:
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = cutoff if cutoff is not None else datetime.utcnow() - timedelta(days=days)
 
         # MongoDB aggregation pipeline using ONLY technology slugs (not skills field)
         pipeline = [
@@ -89,16 +133,30 @@ async def get_trending_skills(days: int = 30, limit: int = 15) -> List[TrendingS
         
     except Exception as e:
         logger.error(f"Error getting trending skills: {str(e)}")
-        return []
+        # Fallback: count in memory if the aggregation pipeline failed but
+        # plain queries still work
+        try:
+            jobs = await JobPosting.find(
+                {"scraped_at": {"$gte": cutoff_date}}
+            ).project(_TechnologySlugsView).to_list()
+            trending_skills = compute_trending_skills_in_memory(jobs, limit=limit)
+            logger.info(f"Computed trending skills in memory for {days} days: {len(trending_skills)} skills")
+            return trending_skills
+        except Exception as fallback_error:
+            logger.error(f"In-memory trending skills fallback failed: {str(fallback_error)}")
+            return []
 
 
-async def get_trending_locations(days: int = 30, limit: int = 10) -> List[TrendingLocation]:
+async def get_trending_locations(
+    days: int = 30, limit: int = 10, cutoff: Optional[datetime] = None
+) -> List[TrendingLocation]:
     """
     Get trending job locations using MongoDB aggregation.
     
     Args:
         days: Number of days to look back for analysis
         limit: Maximum number of locations to return
+        cutoff: Precomputed cutoff datetime (overrides days when provided)
         
     Returns:
         List[TrendingLocation]: Top locations sorted by frequency
@@ -108,7 +166,7 @@ async def get_trending_locations(days: int = 30, limit: int = 10) -> List[Trendi
         logger.info(f"Returning cached trending locations for {days} days")
         return cache[cache_key]
     try:
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
+        cutoff_date = cutoff if cutoff is not None else datetime.utcnow() - timedelta(days=days)
         
         # MongoDB aggregation pipeline
         pipeline = [
@@ -161,17 +219,32 @@ async def get_market_summary(days: int = 30, skills_limit: int = 15, locations_l
         TrendingResponse: Complete market analysis data
     """
     try:
-        top_skills, top_locations, technology_trends, salary_trends, remote_distribution = await asyncio.gather(
-            get_trending_skills(days=days, limit=skills_limit),
-            get_trending_locations(days=days, limit=locations_limit),
-            get_technology_trends(days=days, limit=min(20, skills_limit + 5)),
-            get_salary_trends(days=days),
-            get_remote_job_trends(days=days),
-        )
-
+        # Cheap indexed count first: if no jobs exist in the window, skip
+        # the five aggregations entirely
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         total_jobs = await JobPosting.find({"scraped_at": {"$gte": cutoff_date}}).count()
 
+        if total_jobs == 0:
+            logger.warning(f"No jobs found in the last {days} days; skipping aggregations")
+            return TrendingResponse(
+                top_skills=[],
+                top_locations=[],
+                technology_trends=[],
+                salary_trends=[],
+                remote_distribution=[],
+                total_jobs_analyzed=0,
+                generated_at=datetime.utcnow(),
+                window_days=days,
+            )
+
+        top_skills, top_locations, technology_trends, salary_trends, remote_distribution = await asyncio.gather(
+            get_trending_skills(days=days, limit=skills_limit, cutoff=cutoff_date),
+            get_trending_locations(days=days, limit=locations_limit, cutoff=cutoff_date),
+            get_technology_trends(days=days, limit=min(20, skills_limit + 5), cutoff=cutoff_date),
+            get_salary_trends(days=days, cutoff=cutoff_date),
+            get_remote_job_trends(days=days, cutoff=cutoff_date),
+        )
+
         return TrendingResponse(
             top_skills=top_skills,
             top_locations=top_locations,
@@ -198,13 +271,16 @@ async def get_market_summary(days: int = 30, skills_limit: int = 15, locations_l
         )
 
 
-async def get_technology_trends(days: int = 30, limit: int = 20) -> List[TechnologyTrend]:
+async def get_technology_trends(
+    days: int = 30, limit: int = 20, cutoff: Optional[datetime] = None
+) -> List[TechnologyTrend]:
     cache_key = f"technology_trends_{days}_{limit}"
     if cache_key in cache:
         logger.info("Returning cached technology trends for %s days", days)
         return cache[cache_key]
 
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    if cutoff is None:
+        cutoff = datetime.utcnow() - timedelta(days=days)
     pipeline = [
         {"$match": {"scraped_at": {"$gte": cutoff}, "technology_slugs": {"$exists": True, "$ne": []}}},
         {"$unwind": "$technology_slugs"},
@@ -229,13 +305,16 @@ async def get_technology_trends(days: int = 30, limit: int = 20) -> List[Technol
         return []
 
 
-async def get_salary_trends(days: int = 30, role: str | None = None) -> List[SalaryTrend]:
+async def get_salary_trends(
+    days: int = 30, role: str | None = None, cutoff: Optional[datetime] = None
+) -> List[SalaryTrend]:
     cache_key = f"salary_trends_{days}_{role or 'all'}"
     if cache_key in cache:
         logger.info("Returning cached salary trends for %s days (role=%s)", days, role)
         return cache[cache_key]
 
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    if cutoff is None:
+        cutoff = datetime.utcnow() - timedelta(days=days)
     match: Dict[str, Any] = {
         "scraped_at": {"$gte": cutoff},
         "min_annual_salary_usd": {"$ne": None},
@@ -277,13 +356,14 @@ async def get_salary_trends(days: int = 30, role: str | None = None) -> List[Sal
         return []
 
 
-async def get_remote_job_trends(days: int = 30) -> List[RemoteTrend]:
+async def get_remote_job_trends(days: int = 30, cutoff: Optional[datetime] = None) -> List[RemoteTrend]:
     cache_key = f"remote_trends_{days}"
     if cache_key in cache:
         logger.info("Returning cached remote job trends for %s days", days)
         return cache[cache_key]
 
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    if cutoff is None:
+        cutoff = datetime.utcnow() - timedelta(days=days)
     pipeline = [
         {"$match": {"scraped_at": {"$gte": cutoff}, "remote": {"$in": [True, False]}}},
         {"$group": {"_id": "$remote", "count": {"$sum": 1}}},
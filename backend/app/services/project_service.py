@@ -1,41 +1,94 @@
-import json
+import heapq
 import logging
-from typing import List, Dict, Optional, Tuple
+import numpy as np
+import orjson
+import sys
+from dataclasses import dataclass
+from typing import FrozenSet, List, Dict, Optional, Set, Tuple
 from pathlib import Path
-from cachetools import TTLCache
 
 from app.models.user import User
 from app.schemas.learning import ProjectIdea, ProjectRecommendationsResponse, Difficulty
 
-# Cache for 1 hour to improve performance
-cache = TTLCache(maxsize=100, ttl=3600)
 logger = logging.getLogger(__name__)
 
+# The catalogue ships with the app, so the parsed data and its lookup
+# structures are kept for the life of the process and only re-read if the
+# file changes on disk (mtime check), instead of re-parsing on every TTL
+# expiry.
+_projects_cache: Optional[Tuple[float, "ProjectCatalog"]] = None
+
 # Constants for validation
 DIFFICULTIES = {"Beginner", "Intermediate", "Advanced"}
 
+# Sort order for difficulty levels; unknown values rank as Intermediate
+DIFFICULTY_ORDER = {"Beginner": 1, "Intermediate": 2, "Advanced": 3}
+
+
+@dataclass
+class ProjectCatalog:
+    """Parsed project catalogue plus precomputed request-time lookup structures.
+
+    The precomputed fields use a column-oriented layout: parallel lists
+    indexed by project id, so filters iterate tight homogeneous lists of the
+    one or two fields they touch instead of hopping across per-project
+    objects. Everything is built once when the catalogue is loaded.
+    """
+
+    projects: List[Dict]
+    # Columns of pre-lowercased/normalized fields, parallel to projects
+    titles_lc: List[str]
+    descriptions_lc: List[str]
+    difficulties: List[str]
+    difficulty_ranks: List[int]
+    skills_lc: List[Tuple[str, ...]]
+    features_lc: List[Tuple[str, ...]]
+    skills_sets: List[frozenset]
+    roles_sets: List[frozenset]
+    # Concatenated lowercased searchable text per project, so a query is
+    # one scan per project instead of one per field
+    search_blobs: List[str]
+    # Inverted indexes: normalized skill/role -> ids of projects using it
+    skill_index: Dict[str, FrozenSet[int]]
+    role_index: Dict[str, FrozenSet[int]]
+    # Skill-membership matrix: skill_membership[i, skill_vocab[s]] is 1
+    # when project i requires skill s; skill_counts[i] is the number of
+    # skills project i requires. Stored as uint8 so the matrix-vector
+    # product accumulates integer counts (boolean matmul would OR-reduce).
+    # One product scores every project against a user in C instead of N
+    # Python set intersections.
+    skill_vocab: Dict[str, int]
+    skill_membership: np.ndarray
+    skill_counts: np.ndarray
+    # ProjectIdea instances validated once at load time; search/list paths
+    # return these directly and per-user paths build on them with
+    # model_construct, so no request re-runs Pydantic validation
+    base_models: List[ProjectIdea]
+
 
-def load_project_ideas() -> List[Dict]:
+def load_project_ideas() -> ProjectCatalog:
     """
     Load project ideas from JSON file with caching.
-    
+
     Returns:
-        List[Dict]: List of project ideas
-        
+        ProjectCatalog: Raw project dicts with their precomputed columns and
+        inverted skill/role indexes
+
     Raises:
         Exception: If file cannot be loaded
     """
-    cache_key = "project_ideas"
-    if cache_key in cache:
-        logger.info("Returning cached project ideas")
-        return cache[cache_key]
-    
+    global _projects_cache
+
     try:
         # Path to the project ideas JSON file
         projects_path = Path(__file__).parent.parent.parent / "project_ideas.json"
-        
-        with open(projects_path, 'r', encoding='utf-8') as file:
-            projects_data = json.load(file)
+
+        mtime = projects_path.stat().st_mtime
+        if _projects_cache is not None and _projects_cache[0] == mtime:
+            return _projects_cache[1]
+
+        # orjson parses in C, noticeably faster than stdlib json on cache misses
+        projects_data = orjson.loads(projects_path.read_bytes())
         
         # Handle both old format (direct array) and new format (with "projects" key)
         if isinstance(projects_data, dict) and "projects" in projects_data:
@@ -45,16 +98,81 @@ def load_project_ideas() -> List[Dict]:
         else:
             raise ValueError("Invalid project data format")
         
-        # Cache the loaded data
-        cache[cache_key] = projects_list
+        # Build the precomputed columns and inverted indexes once, then
+        # cache the catalogue keyed on file mtime
+        titles_lc = []
+        descriptions_lc = []
+        difficulties = []
+        difficulty_ranks = []
+        skills_lc = []
+        features_lc = []
+        skills_sets = []
+        roles_sets = []
+        search_blobs = []
+        skill_index: Dict[str, Set[int]] = {}
+        role_index: Dict[str, Set[int]] = {}
+
+        for i, project in enumerate(projects_list):
+            project_skills_lc = tuple(normalize_skill_name(skill) for skill in project.get("skills", []))
+            project_roles_lc = frozenset(normalize_skill_name(role) for role in project.get("roles") or [])
+            project_skills_set = frozenset(project_skills_lc)
+
+            titles_lc.append(project.get("title", "").lower())
+            descriptions_lc.append(project.get("description", "").lower())
+            difficulties.append(project.get("difficulty", ""))
+            difficulty_ranks.append(DIFFICULTY_ORDER.get(project.get("difficulty"), 2))
+            skills_lc.append(project_skills_lc)
+            features_lc.append(tuple(feature.lower() for feature in project.get("features", [])))
+            skills_sets.append(project_skills_set)
+            roles_sets.append(project_roles_lc)
+            search_blobs.append(
+                " ".join((titles_lc[-1], descriptions_lc[-1], *features_lc[-1], *project_skills_lc))
+            )
+
+            for skill in project_skills_set:
+                skill_index.setdefault(skill, set()).add(i)
+            for role in project_roles_lc:
+                role_index.setdefault(role, set()).add(i)
+
+        # Freeze the posting sets: the catalogue is shared across requests,
+        # and frozensets make accidental mutation impossible
+        skill_index = {skill: frozenset(ids) for skill, ids in skill_index.items()}
+        role_index = {role: frozenset(ids) for role, ids in role_index.items()}
+
+        skill_vocab = {skill: idx for idx, skill in enumerate(skill_index)}
+        skill_membership = np.zeros((len(projects_list), len(skill_vocab)), dtype=np.uint8)
+        for i, project_skills_set in enumerate(skills_sets):
+            for skill in project_skills_set:
+                skill_membership[i, skill_vocab[skill]] = 1
+        skill_counts = skill_membership.sum(axis=1).astype(np.float32)
+
+        catalog = ProjectCatalog(
+            projects=projects_list,
+            titles_lc=titles_lc,
+            descriptions_lc=descriptions_lc,
+            difficulties=difficulties,
+            difficulty_ranks=difficulty_ranks,
+            skills_lc=skills_lc,
+            features_lc=features_lc,
+            skills_sets=skills_sets,
+            roles_sets=roles_sets,
+            search_blobs=search_blobs,
+            skill_index=skill_index,
+            role_index=role_index,
+            skill_vocab=skill_vocab,
+            skill_membership=skill_membership,
+            skill_counts=skill_counts,
+            base_models=[ProjectIdea(**project) for project in projects_list],
+        )
+        _projects_cache = (mtime, catalog)
         logger.info(f"Loaded {len(projects_list)} project ideas")
-        
-        return projects_list
+
+        return catalog
         
     except FileNotFoundError:
         logger.error(f"Project ideas file not found at {projects_path}")
         raise Exception("Project ideas data file not found")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Invalid JSON in project ideas file: {e}")
         raise Exception("Invalid project ideas data format")
     except Exception as e:
@@ -65,92 +183,101 @@ def load_project_ideas() -> List[Dict]:
 def normalize_skill_name(skill: str) -> str:
     """
     Normalize skill name for consistent matching.
-    
+
+    The result is interned: the same skills recur across hundreds of
+    catalogue entries and every user profile, so interning deduplicates the
+    strings and lets set/dict lookups short-circuit on identity.
+
     Args:
         skill: Raw skill name
         
     Returns:
-        str: Normalized skill name (lowercase, stripped)
+        str: Normalized skill name (lowercase, stripped, interned)
     """
-    return skill.lower().strip()
+    return sys.intern(skill.lower().strip())
+
 
+def normalize_user_skills(user_skills: List[str]) -> frozenset:
+    """Normalize a user's skills into a frozenset for repeated match checks."""
+    return frozenset(normalize_skill_name(skill) for skill in user_skills)
 
-def calculate_skill_match(user_skills: List[str], project_skills: List[str]) -> Tuple[float, List[str]]:
+
+def calculate_skill_match(
+    user_skills_set: frozenset,
+    project_skills: List[str],
+    project_skills_lc: Optional[Tuple[str, ...]] = None,
+) -> Tuple[float, List[str]]:
     """
     Calculate skill match percentage between user and project skills.
-    
+
     Args:
-        user_skills: List of user's skills
+        user_skills_set: User's skills, pre-normalized via normalize_user_skills
         project_skills: List of skills required for the project
-        
+        project_skills_lc: Optional pre-normalized project skills parallel to
+            project_skills (from the catalogue index); computed if omitted
+
     Returns:
         Tuple[float, List[str]]: (match_percentage, missing_skills)
     """
     if not project_skills:
         return 100.0, []
-    
-    # Normalize skills for case-insensitive comparison
-    user_skills_normalized = {normalize_skill_name(skill) for skill in user_skills}
-    project_skills_normalized = [normalize_skill_name(skill) for skill in project_skills]
-    
-    # Calculate matches and missing skills
-    matched_skills = 0
-    missing_skills = []
-    
-    for project_skill in project_skills:
-        project_skill_normalized = normalize_skill_name(project_skill)
-        if project_skill_normalized in user_skills_normalized:
-            matched_skills += 1
-        else:
-            missing_skills.append(project_skill)
-    
+
+    if project_skills_lc is None:
+        project_skills_lc = tuple(normalize_skill_name(skill) for skill in project_skills)
+
+    # One membership pass collects missing skills; matches follow by count
+    missing_skills = [
+        original
+        for original, normalized in zip(project_skills, project_skills_lc)
+        if normalized not in user_skills_set
+    ]
+    matched_skills = len(project_skills) - len(missing_skills)
+
     match_percentage = (matched_skills / len(project_skills)) * 100
     return round(match_percentage, 2), missing_skills
 
 
-def filter_projects_by_difficulty(projects: List[Dict], difficulty: str) -> List[Dict]:
+def filter_projects_by_difficulty(difficulties: List[str], difficulty: str) -> List[int]:
     """
     Filter projects by difficulty level.
-    
+
     Args:
-        projects: List of project dictionaries
+        difficulties: Difficulty column from the catalogue
         difficulty: Difficulty level to filter by
-        
+
     Returns:
-        List[Dict]: Filtered projects
+        List[int]: Ids of projects matching the difficulty
     """
     if difficulty not in DIFFICULTIES:
-        return projects
-    
-    return [p for p in projects if p.get("difficulty") == difficulty]
+        return list(range(len(difficulties)))
+
+    return [i for i, d in enumerate(difficulties) if d == difficulty]
 
 
-def get_skill_building_projects(missing_skills: List[str], projects: List[Dict]) -> List[Dict]:
+def get_skill_building_projects(missing_skills: List[str], catalog: ProjectCatalog) -> List[Dict]:
     """
     Get projects that help build specific missing skills.
-    
+
     Args:
         missing_skills: List of skills the user needs to learn
-        projects: List of all available projects
-        
+        catalog: Loaded project catalogue
+
     Returns:
         List[Dict]: Projects that teach the missing skills
     """
     if not missing_skills:
         return []
-    
-    missing_skills_normalized = {normalize_skill_name(skill) for skill in missing_skills}
-    skill_building_projects = []
-    
-    for project in projects:
-        project_skills = project.get("skills", [])
-        project_skills_normalized = {normalize_skill_name(skill) for skill in project_skills}
-        
-        # Check if project teaches any missing skills
-        if missing_skills_normalized.intersection(project_skills_normalized):
-            skill_building_projects.append(project)
-    
-    return skill_building_projects
+
+    # Union the inverted-index postings for the missing skills; only the
+    # matching projects are touched instead of scanning the whole catalogue.
+    # The lookups are bound as locals to keep the generator tight.
+    postings = catalog.skill_index.get
+    normalize = normalize_skill_name
+    matching_ids = set().union(
+        *(postings(normalize(skill), frozenset()) for skill in missing_skills)
+    )
+
+    return [catalog.projects[i] for i in sorted(matching_ids)]
 
 
 async def get_project_recommendations(
@@ -173,61 +300,77 @@ async def get_project_recommendations(
         ProjectRecommendationsResponse: Personalized project recommendations
     """
     try:
-        # Load project ideas
-        projects_data = load_project_ideas()
-        
-        # Apply difficulty filter
-        if difficulty and difficulty in DIFFICULTIES:
-            projects_data = filter_projects_by_difficulty(projects_data, difficulty)
-
-        # Apply role filter if provided
-        if target_role:
-            normalized_role = normalize_skill_name(target_role)
-            projects_with_roles = []
-            for project in projects_data:
-                project_roles = project.get("roles") or []
-                project_roles_normalized = {normalize_skill_name(role) for role in project_roles}
-                if normalized_role in project_roles_normalized:
-                    projects_with_roles.append(project)
-            projects_data = projects_with_roles
-
-        # Apply skill focus filter
-        if skill_focus:
-            skill_focus_normalized = {normalize_skill_name(skill) for skill in skill_focus}
-            filtered_projects = []
-            
-            for project in projects_data:
-                project_skills = project.get("skills", [])
-                project_skills_normalized = {normalize_skill_name(skill) for skill in project_skills}
-                
-                # Include project if it uses any of the focus skills
-                if skill_focus_normalized.intersection(project_skills_normalized):
-                    filtered_projects.append(project)
-            
-            projects_data = filtered_projects
-        
-        # Calculate skill matches and sort by match percentage
+        # Load the project catalogue with its precomputed indexes
+        catalog = load_project_ideas()
+        projects_data = catalog.projects
+
+        # Resolve the filters up front, then apply all three in one fused
+        # pass over the columns instead of materializing an intermediate
+        # candidate list per filter
+        want_difficulty = difficulty if difficulty in DIFFICULTIES else None
+        want_role = normalize_skill_name(target_role) if target_role else None
+        want_skills = (
+            frozenset(normalize_skill_name(skill) for skill in skill_focus)
+            if skill_focus else None
+        )
+
+        difficulties = catalog.difficulties
+        roles_sets = catalog.roles_sets
+        skills_sets = catalog.skills_sets
+        candidate_ids = [
+            i
+            for i in range(len(projects_data))
+            if (want_difficulty is None or difficulties[i] == want_difficulty)
+            and (want_role is None or want_role in roles_sets[i])
+            and (want_skills is None or not want_skills.isdisjoint(skills_sets[i]))
+        ]
+
+        # Score every project against the user with one matrix-vector
+        # product over the load-time membership matrix instead of a Python
+        # set intersection per project
         user_skills = user.skills or []
-        project_recommendations = []
-        
-        for project_data in projects_data:
-            match_percentage, missing_skills = calculate_skill_match(user_skills, project_data.get("skills", []))
-            
-            project = ProjectIdea(
-                **project_data,
-                skill_match_percentage=match_percentage,
-                missing_skills=missing_skills
+        user_skills_set = normalize_user_skills(user_skills)
+        skill_vocab = catalog.skill_vocab
+        user_vec = np.zeros(len(skill_vocab), dtype=np.uint8)
+        user_indices = [skill_vocab[skill] for skill in user_skills_set if skill in skill_vocab]
+        if user_indices:
+            user_vec[user_indices] = 1
+        matched_counts = catalog.skill_membership @ user_vec
+        skill_counts = catalog.skill_counts
+        # Projects without listed skills count as a full match
+        match_pcts = np.where(skill_counts > 0, matched_counts / skill_counts * 100.0, 100.0)
+
+        # Decorate with the sort key up front so selection compares plain
+        # tuples instead of calling a key lambda per comparison; difficulty
+        # ranks are precomputed ints from the catalogue
+        difficulty_ranks = catalog.difficulty_ranks
+        decorated = []
+        decorated_append = decorated.append
+        for i in candidate_ids:
+            decorated_append((-float(match_pcts[i]), difficulty_ranks[i], i))
+
+        # Select the top entries by skill match percentage (descending) and
+        # then by difficulty; nsmallest is O(N log limit) versus sorting the
+        # whole candidate list for the usual case of limit << N
+        total_candidates = len(decorated)
+
+        # Materialize models and missing-skill lists only for the projects
+        # that survive the cut; the catalogue was validated at load time so
+        # construction skips the validators
+        construct_project = ProjectIdea.model_construct
+        limited_projects = []
+        for _neg_pct, _rank, i in heapq.nsmallest(limit, decorated):
+            project_data = projects_data[i]
+            match_percentage, missing_skills = calculate_skill_match(
+                user_skills_set, project_data.get("skills", []), catalog.skills_lc[i]
+            )
+            limited_projects.append(
+                construct_project(
+                    **project_data,
+                    skill_match_percentage=match_percentage,
+                    missing_skills=missing_skills,
+                )
             )
-            project_recommendations.append(project)
-        
-        # Sort by skill match percentage (descending) and then by difficulty
-        difficulty_order = {"Beginner": 1, "Intermediate": 2, "Advanced": 3}
-        project_recommendations.sort(
-            key=lambda p: (-p.skill_match_percentage, difficulty_order.get(p.difficulty, 2))
-        )
-        
-        # Apply limit
-        limited_projects = project_recommendations[:limit]
         
         # Generate recommendations
         recommendations = []
@@ -262,7 +405,7 @@ async def get_project_recommendations(
         
         return ProjectRecommendationsResponse(
             projects=limited_projects,
-            total_projects=len(project_recommendations),
+            total_projects=total_candidates,
             filters_applied=filters_applied,
             user_skill_count=len(user_skills),
             recommendations=recommendations
@@ -305,46 +448,46 @@ async def search_projects(
         Tuple[List[ProjectIdea], int]: (projects, total_count)
     """
     try:
-        projects_data = load_project_ideas()
-        query_lower = query.lower()
-        matching_projects = []
-        
-        for project_data in projects_data:
-            # Search in title, description, and features
-            title_match = query_lower in project_data.get("title", "").lower()
-            description_match = query_lower in project_data.get("description", "").lower()
-            features_match = any(query_lower in feature.lower() for feature in project_data.get("features", []))
-            skills_match = any(query_lower in skill.lower() for skill in project_data.get("skills", []))
-            
-            if title_match or description_match or features_match or skills_match:
-                matching_projects.append(project_data)
-        
-        # Apply difficulty filter
+        catalog = load_project_ideas()
+        q = query.lower()
+        terms = set(q.split())
+        search_blobs = catalog.search_blobs
+
+        if len(terms) <= 1:
+            # Single-term query: plain substring test against the
+            # pre-lowercased per-project blob
+            matching_ids = [i for i, blob in enumerate(search_blobs) if q in blob]
+        else:
+            # Multi-term query: every term must occur in the blob. Per-term
+            # substring tests stay correct when terms overlap (same scheme
+            # as the learning-resource search)
+            matching_ids = [
+                i
+                for i, blob in enumerate(search_blobs)
+                if all(term in blob for term in terms)
+            ]
+
+        # Apply difficulty filter over the difficulty column
         if difficulty and difficulty in DIFFICULTIES:
-            matching_projects = filter_projects_by_difficulty(matching_projects, difficulty)
-        
-        # Apply skills filter
+            difficulties = catalog.difficulties
+            matching_ids = [i for i in matching_ids if difficulties[i] == difficulty]
+
+        # Apply skills filter via the inverted skill index
         if skills:
-            skills_normalized = {normalize_skill_name(skill) for skill in skills}
-            filtered_projects = []
-            
-            for project in matching_projects:
-                project_skills = project.get("skills", [])
-                project_skills_normalized = {normalize_skill_name(skill) for skill in project_skills}
-                
-                # Include project if it uses any of the specified skills
-                if skills_normalized.intersection(project_skills_normalized):
-                    filtered_projects.append(project)
-            
-            matching_projects = filtered_projects
-        
-        total_count = len(matching_projects)
-        
+            postings = catalog.skill_index.get
+            normalize = normalize_skill_name
+            skills_ids = set().union(
+                *(postings(normalize(skill), frozenset()) for skill in skills)
+            )
+            matching_ids = [i for i in matching_ids if i in skills_ids]
+
+        total_count = len(matching_ids)
+
         # Apply pagination
-        paginated_projects = matching_projects[offset:offset + limit]
-        
-        # Convert to ProjectIdea objects
-        project_ideas = [ProjectIdea(**project_data) for project_data in paginated_projects]
+        paginated_ids = matching_ids[offset:offset + limit]
+
+        # Return the cached pre-validated instances directly
+        project_ideas = [catalog.base_models[i] for i in paginated_ids]
         
         logger.info(f"Search for '{query}' found {total_count} projects, returning {len(project_ideas)}")
         return project_ideas, total_count
@@ -371,19 +514,17 @@ async def get_all_projects(
         Tuple[List[ProjectIdea], int]: (projects, total_count)
     """
     try:
-        projects_data = load_project_ideas()
-        
+        catalog = load_project_ideas()
+        project_models = catalog.base_models
+
         # Apply difficulty filter
         if difficulty and difficulty in DIFFICULTIES:
-            projects_data = filter_projects_by_difficulty(projects_data, difficulty)
-        
-        total_count = len(projects_data)
-        
-        # Apply pagination
-        paginated_projects = projects_data[offset:offset + limit]
-        
-        # Convert to ProjectIdea objects
-        project_ideas = [ProjectIdea(**project_data) for project_data in paginated_projects]
+            project_models = [p for p in project_models if p.difficulty == difficulty]
+
+        total_count = len(project_models)
+
+        # Apply pagination over the cached pre-validated instances
+        project_ideas = project_models[offset:offset + limit]
         
         logger.info(f"Retrieved {len(project_ideas)} projects (total: {total_count})")
         return project_ideas, total_count
@@ -1,7 +1,7 @@
-import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional
 
+from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -19,6 +19,10 @@ logger = logging.getLogger(__name__)
 class SchedulerService:
     """Service responsible for orchestrating background job ingestion and maintenance."""
 
+    # Process-wide instance: repeated construction (tests, uvicorn reloads)
+    # must not spin up duplicate schedulers with duplicate cron jobs
+    _instance: ClassVar[Optional["SchedulerService"]] = None
+
     def __init__(
         self,
         roles: Optional[List[str]] = None,
@@ -26,7 +30,9 @@ class SchedulerService:
         collection_service: Optional[JobCollectionService] = None,
         use_user_roles: bool = True,
     ) -> None:
-        self.scheduler = AsyncIOScheduler()
+        # The scheduler itself is created lazily in start_scheduler so that
+        # merely instantiating the service stays cheap and loop-free
+        self.scheduler: Optional[AsyncIOScheduler] = None
         self.roles = roles or []
         self.locations = locations or []
         self.collection_service = collection_service or JobCollectionService()
@@ -36,12 +42,35 @@ class SchedulerService:
         self._cleanup_job_id = "weekly-job-cleanup"
         self._started = False
 
+    @classmethod
+    def get(
+        cls,
+        roles: Optional[List[str]] = None,
+        locations: Optional[List[str]] = None,
+        collection_service: Optional[JobCollectionService] = None,
+        use_user_roles: bool = True,
+    ) -> "SchedulerService":
+        """Return the shared scheduler service, creating it on first use."""
+        if cls._instance is None:
+            cls._instance = cls(
+                roles=roles,
+                locations=locations,
+                collection_service=collection_service,
+                use_user_roles=use_user_roles,
+            )
+        return cls._instance
+
     async def start_scheduler(self) -> None:
         """Start the scheduler and register recurring jobs."""
         if self._started:
             logger.info("Scheduler already started; skipping duplicate start")
             return
 
+        if self.scheduler is None:
+            # Explicit in-memory job store: jobs are re-registered on every
+            # start, so there is nothing worth pickling to a persistent store
+            self.scheduler = AsyncIOScheduler(jobstores={"default": MemoryJobStore()})
+
         self._register_jobs()
         self.scheduler.start()
         self._started = True
@@ -128,12 +157,6 @@ class SchedulerService:
             logger.warning("No roles configured for job collection; skipping run")
             return {}
 
-        # APScheduler expects coroutine to be awaited; ensure we run inside loop
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
         try:
             summary = await self.collection_service.collect_jobs_for_roles(
                 roles=roles,
@@ -154,11 +177,6 @@ class SchedulerService:
 
     async def _run_user_based_collection(self) -> Dict[str, Dict[str, int]]:
         """Run job collection based on all users' target roles."""
-        loop = asyncio.get_event_loop()
-        if loop.is_closed():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
         try:
             summary = await self.user_collection_service.collect_jobs_for_all_users(
                 max_age_days=30,  # Search for jobs posted in last 30 days (increased from 14)
@@ -1,6 +1,13 @@
+import asyncio
+import heapq
 import logging
+import math
+import re
+import time
+from functools import cache, lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
+from cachetools import TTLCache
 
 from app.models.job_posting import JobPosting
 from app.core.config import settings
@@ -14,13 +21,73 @@ from app.services.theirstack_client import (
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _prefix_regex(value: str) -> str:
+    """Anchored, escaped, lowercased prefix pattern for a filter value."""
+    return "^" + re.escape(value.lower())
+
+
+# Matches bare two-letter ISO country codes; bound to the C-level match so
+# location classification is one call per element
+_ISO_COUNTRY_CODE = re.compile(r"^[A-Za-z]{2}$").match
+
+# Short-lived cache for the analytics endpoints: both scan up to 30 days of
+# postings, and dashboards tend to hit them in bursts. 60 seconds bounds
+# staleness after a new batch lands.
+_analytics_cache: TTLCache = TTLCache(maxsize=8, ttl=60)
+
+
+@cache
+def _get_skill_extractor():
+    """Import the shared skill extractor on first use.
+
+    Deferred because importing the module loads the spaCy model; the cache
+    turns every later call into a dict lookup instead of re-running the
+    import machinery.
+    """
+    from app.services.skill_extractor import skill_extractor
+
+    return skill_extractor
+
 
 class ScraperService:
     """Service for managing job collection operations via TheirStack API."""
 
+    # Circuit breaker: after an authentication failure every collection with
+    # the same credentials is doomed, so further calls short-circuit for a
+    # while instead of burning retries and rate-limit quota
+    _auth_block_until: float = 0.0
+    _AUTH_CIRCUIT_SECONDS: float = 60.0
+
+    @classmethod
+    def reset_auth_circuit(cls) -> None:
+        """Re-enable collections immediately, e.g. after rotating the API key."""
+        cls._auth_block_until = 0.0
+
     def __init__(self, client: Optional[TheirStackClient] = None):
         self.client = client or their_stack_client
-        self.active_jobs: Dict[str, Dict[str, Any]] = {}
+        # Bounded status map: every collection run adds an entry, so an
+        # unbounded dict is a slow leak in a long-lived process. Statuses
+        # expire after a day or when the 1000 most recent push them out.
+        self.active_jobs: TTLCache = TTLCache(maxsize=1000, ttl=24 * 3600)
+
+    async def close(self) -> None:
+        """Shut down the underlying TheirStack client gracefully."""
+        await self.client.close()
+
+    @staticmethod
+    def _extract_jobs(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Pull the job list out of a TheirStack search response."""
+        jobs = (
+            response.get("data")
+            or response.get("jobs")
+            or response.get("results")
+            or []
+        )
+        if not isinstance(jobs, list):
+            logger.error("Unexpected TheirStack response format: %s", response)
+            raise TheirStackClientError("Unexpected TheirStack response format")
+        return jobs
 
     async def run_theirstack_collection(
         self,
@@ -45,8 +112,19 @@ class ScraperService:
         if not keywords:
             raise ValueError("At least one keyword must be provided")
 
-        job_id = f"their_stack_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}"
+        if time.monotonic() < ScraperService._auth_block_until:
+            logger.warning("Skipping TheirStack collection: auth circuit open after recent authentication failure")
+            return {
+                "job_id": None,
+                "status": "failed",
+                "errors": ["TheirStack authentication circuit open; retry later"],
+            }
+
         start_time = datetime.utcnow()
+        job_id = f"their_stack_{start_time.strftime('%Y%m%d_%H%M%S')}"
+        # Durations come from the monotonic clock; datetimes are only built
+        # for the timestamps actually stored
+        started_monotonic = time.monotonic()
         remaining = max(limit, 0)
         page = 1
         collected_jobs: List[Dict[str, Any]] = []
@@ -71,93 +149,136 @@ class ScraperService:
                 locations,
             )
 
-            location_patterns = []
-            country_codes = []
-            for loc in locations:
-                if not loc:
-                    continue
-                stripped = loc.strip()
-                if len(stripped) == 2 and stripped.isalpha():
-                    country_codes.append(stripped.upper())
-                else:
-                    location_patterns.append(stripped)
-
-            while remaining != 0:
-                page_limit = min(settings.max_jobs_per_search, remaining) if remaining > 0 else settings.max_jobs_per_search
-                payload: Dict[str, Any] = {
-                    "job_title_or": keywords,
-                    "posted_at_max_age_days": max_age_days,
-                    "page": page,
-                    "limit": page_limit,
-                }
-
-                if location_patterns:
-                    payload["job_location_pattern_or"] = location_patterns
-                if country_codes:
-                    payload["job_country_code_or"] = country_codes
-
-                logger.debug("Calling TheirStack page=%s limit=%s payload=%s", page, page_limit, payload)
-
-                response = await self.client.search_jobs(payload)
-
-                jobs = (
-                    response.get("data")
-                    or response.get("jobs")
-                    or response.get("results")
-                    or []
-                )
-
-                if not isinstance(jobs, list):
-                    logger.error("Unexpected TheirStack response format: %s", response)
-                    raise TheirStackClientError("Unexpected TheirStack response format")
-
-                fetched_count = len(jobs)
-
-                if fetched_count == 0:
-                    logger.info("No more jobs returned by TheirStack; stopping pagination")
-                    break
-
-                collected_jobs.extend(jobs)
-                if remaining > 0:
-                    remaining = max(remaining - fetched_count, 0)
-
-                self.active_jobs[job_id]["fetched"] = len(collected_jobs)
-                self.active_jobs[job_id]["pages"] = page
+            stripped_locations = [loc.strip() for loc in locations if loc]
+            country_codes = [loc.upper() for loc in stripped_locations if _ISO_COUNTRY_CODE(loc)]
+            location_patterns = [loc for loc in stripped_locations if not _ISO_COUNTRY_CODE(loc)]
 
-                logger.info(
-                    "TheirStack collection %s fetched %s jobs on page %s (remaining=%s)",
-                    job_id,
-                    fetched_count,
-                    page,
-                    remaining,
-                )
-
-                meta = response.get("meta") or {}
-                total_pages = meta.get("total_pages") or meta.get("pages")
-                has_next = meta.get("has_more")
-
-                if remaining == 0:
-                    break
-
-                if has_next is False:
-                    break
-
-                if total_pages and page >= total_pages:
-                    break
+            job_state = self.active_jobs[job_id]
+            page_limit = min(settings.max_jobs_per_search, remaining) if remaining > 0 else settings.max_jobs_per_search
+            base_payload: Dict[str, Any] = {
+                "job_title_or": keywords,
+                "posted_at_max_age_days": max_age_days,
+                "limit": page_limit,
+            }
 
-                next_page = meta.get("next_page")
-                if next_page:
-                    page = next_page
+            if location_patterns:
+                base_payload["job_location_pattern_or"] = location_patterns
+            if country_codes:
+                base_payload["job_country_code_or"] = country_codes
+
+            # Fetch page 1 serially so the response meta tells us how many
+            # pages exist, then fan out the remaining pages concurrently
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Calling TheirStack page=1 limit=%s payload=%s", page_limit, base_payload)
+            response = await self.client.search_jobs(dict(base_payload, page=1))
+            jobs = self._extract_jobs(response)
+            collected_jobs.extend(jobs)
+            if remaining > 0:
+                remaining = max(remaining - len(jobs), 0)
+
+            job_state["fetched"] = len(collected_jobs)
+            job_state["pages"] = 1 if jobs else 0
+
+            meta = response.get("meta") or {}
+            total_pages = meta.get("total_pages") or meta.get("pages")
+            has_next = meta.get("has_more")
+
+            if jobs and remaining != 0 and has_next is not False:
+                if total_pages and total_pages > 1:
+                    # Bound the fan-out by both the API's page count and the
+                    # pages actually needed to satisfy the requested limit
+                    last_page = total_pages
+                    if remaining > 0:
+                        last_page = min(last_page, 1 + math.ceil(remaining / page_limit))
+
+                    semaphore = asyncio.Semaphore(settings.max_concurrent_pages)
+                    state_lock = asyncio.Lock()
+
+                    async def fetch_page(page_number: int) -> List[Dict[str, Any]]:
+                        async with semaphore:
+                            page_response = await self.client.search_jobs(
+                                dict(base_payload, page=page_number)
+                            )
+                        page_jobs = self._extract_jobs(page_response)
+                        async with state_lock:
+                            job_state["fetched"] += len(page_jobs)
+                            job_state["pages"] = max(job_state["pages"], page_number)
+                        return page_jobs
+
+                    page_numbers = range(2, last_page + 1)
+                    results = await asyncio.gather(
+                        *(fetch_page(page_number) for page_number in page_numbers),
+                        return_exceptions=True,
+                    )
+                    # Merge in page order; a failed page is recorded as an
+                    # error without aborting the rest of the batch
+                    for page_number, result in zip(page_numbers, results):
+                        if isinstance(result, BaseException):
+                            logger.error(
+                                "TheirStack collection %s failed on page %s: %s",
+                                job_id,
+                                page_number,
+                                result,
+                            )
+                            errors.append(f"page {page_number}: {result}")
+                        else:
+                            collected_jobs.extend(result)
+
+                    if limit > 0:
+                        collected_jobs = collected_jobs[:limit]
+                    job_state["fetched"] = len(collected_jobs)
                 else:
-                    page += 1
-
-            duration = (datetime.utcnow() - start_time).total_seconds()
+                    # Page count unknown: fall back to serial pagination
+                    page = meta.get("next_page") or 2
+                    while remaining != 0:
+                        # Shrink the per-page request as the limit approaches
+                        # so the last page doesn't over-fetch past it
+                        page_limit = (
+                            min(settings.max_jobs_per_search, remaining)
+                            if remaining > 0
+                            else settings.max_jobs_per_search
+                        )
+                        logger.debug("Calling TheirStack page=%s limit=%s", page, page_limit)
+                        response = await self.client.search_jobs(
+                            dict(base_payload, page=page, limit=page_limit)
+                        )
+                        jobs = self._extract_jobs(response)
+
+                        if not jobs:
+                            logger.info("No more jobs returned by TheirStack; stopping pagination")
+                            break
+
+                        collected_jobs.extend(jobs)
+                        if remaining > 0:
+                            remaining = max(remaining - len(jobs), 0)
+
+                        job_state["fetched"] = len(collected_jobs)
+                        job_state["pages"] = page
+
+                        logger.info(
+                            "TheirStack collection %s fetched %s jobs on page %s (remaining=%s)",
+                            job_id,
+                            len(jobs),
+                            page,
+                            remaining,
+                        )
+
+                        meta = response.get("meta") or {}
+                        if meta.get("has_more") is False:
+                            break
+                        page = meta.get("next_page") or page + 1
+
+                    if limit > 0:
+                        collected_jobs = collected_jobs[:limit]
+                        job_state["fetched"] = len(collected_jobs)
+
+            duration = time.monotonic() - started_monotonic
 
             result_payload = {
                 "job_id": job_id,
                 "status": "completed",
                 "fetched_count": len(collected_jobs),
-                "pages": self.active_jobs[job_id]["pages"],
+                "pages": job_state["pages"],
                 "duration_seconds": duration,
                 "errors": errors,
                 "jobs": collected_jobs,
@@ -180,7 +301,24 @@ class ScraperService:
 
             return result_payload
 
-        except (TheirStackClientError, TheirStackRetryableError, TheirStackAuthenticationError) as exc:
+        except TheirStackAuthenticationError as exc:
+            error_message = str(exc)
+            logger.error("TheirStack collection %s failed authentication: %s", job_id, error_message)
+            ScraperService._auth_block_until = time.monotonic() + self._AUTH_CIRCUIT_SECONDS
+            errors.append(error_message)
+            self.active_jobs[job_id].update(
+                {
+                    "status": "failed",
+                    "end_time": datetime.utcnow(),
+                    "error": error_message,
+                }
+            )
+            return {
+                "job_id": job_id,
+                "status": "failed",
+                "errors": errors,
+            }
+        except (TheirStackClientError, TheirStackRetryableError) as exc:
             error_message = str(exc)
             logger.error("TheirStack collection %s failed: %s", job_id, error_message)
             errors.append(error_message)
@@ -225,6 +363,65 @@ class ScraperService:
         """
         return self.active_jobs.get(job_id)
     
+    async def stream_scraped_jobs(
+        self,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        skills: Optional[List[str]] = None,
+        days_back: int = 7,
+        limit: int = 50
+    ):
+        """
+        Stream scraped job postings with optional filters.
+
+        Yields each JobPosting as it arrives from the cursor, so callers
+        that forward results (e.g. a streaming HTTP response) never hold
+        the full result set in memory.
+
+        Args:
+            keywords: Filter by search keywords
+            location: Filter by job location
+            skills: Filter by required skills
+            days_back: Number of days back to search
+            limit: Maximum number of jobs to return
+
+        Yields:
+            JobPosting documents, most recently scraped first
+        """
+        query_filters = []
+
+        # Date filter
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+        query_filters.append(JobPosting.scraped_at >= cutoff_date)
+
+        # Keywords filter: anchored prefix match on the indexed
+        # lowercase field; an unanchored case-insensitive regex on the
+        # raw field forces a collection scan
+        if keywords:
+            query_filters.append(
+                {"search_keywords_lc": {"$regex": _prefix_regex(keywords)}}
+            )
+
+        # Location filter, same indexed prefix scheme
+        if location:
+            query_filters.append(
+                {"location_lc": {"$regex": _prefix_regex(location)}}
+            )
+
+        # Skills filter
+        if skills:
+            query_filters.append(
+                JobPosting.skills.in_(skills)
+            )
+
+        cursor = (
+            JobPosting.find(*query_filters)
+            .sort(-JobPosting.scraped_at)
+            .limit(limit)
+        )
+        async for job in cursor:
+            yield job
+
     async def get_scraped_jobs(
         self,
         keywords: Optional[str] = None,
@@ -236,6 +433,9 @@ class ScraperService:
         """
         Retrieve scraped job postings with optional filters.
         
+        Materializing wrapper around stream_scraped_jobs for callers that
+        need the full list.
+
         Args:
             keywords: Filter by search keywords
             location: Filter by job location
@@ -247,38 +447,16 @@ class ScraperService:
             List of JobPosting documents
         """
         try:
-            query_filters = []
-            
-            # Date filter
-            cutoff_date = datetime.utcnow() - timedelta(days=days_back)
-            query_filters.append(JobPosting.scraped_at >= cutoff_date)
-            
-            # Keywords filter
-            if keywords:
-                query_filters.append(
-                    JobPosting.search_keywords.regex(keywords, "i")
-                )
-            
-            # Location filter
-            if location:
-                query_filters.append(
-                    JobPosting.location.regex(location, "i")
-                )
-            
-            # Skills filter
-            if skills:
-                query_filters.append(
-                    JobPosting.skills.in_(skills)
+            jobs = [
+                job
+                async for job in self.stream_scraped_jobs(
+                    keywords=keywords,
+                    location=location,
+                    skills=skills,
+                    days_back=days_back,
+                    limit=limit,
                 )
-            
-            # Build query
-            if query_filters:
-                query = JobPosting.find(*query_filters)
-            else:
-                query = JobPosting.find()
-            
-            # Execute query
-            jobs = await query.sort(-JobPosting.scraped_at).limit(limit).to_list()
+            ]
             
             logger.info(f"Retrieved {len(jobs)} scraped jobs with filters: "
                        f"keywords={keywords}, location={location}, skills={skills}")
@@ -299,54 +477,74 @@ class ScraperService:
         Returns:
             Dict containing scraping statistics
         """
+        cache_key = ("statistics", days_back)
+        cached = _analytics_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached scraping statistics for %s days", days_back)
+            return cached
+
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_back)
-            
-            # Basic counts
-            total_jobs = await JobPosting.find(
-                JobPosting.scraped_at >= cutoff_date
-            ).count()
-            
-            # Get recent jobs for analysis
-            recent_jobs = await JobPosting.find(
-                JobPosting.scraped_at >= cutoff_date
-            ).to_list()
-            
-            # Analyze data
-            companies = set()
-            locations = set()
-            all_skills = []
-            search_keywords = set()
-            
-            for job in recent_jobs:
-                companies.add(job.company)
-                locations.add(job.location)
-                all_skills.extend(job.skills)
-                search_keywords.add(job.search_keywords)
-            
-            # Count skill frequencies
-            skill_counts = {}
-            for skill in all_skills:
-                skill_counts[skill] = skill_counts.get(skill, 0) + 1
-            
-            # Get top skills
-            top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:20]
-            
+            now = datetime.utcnow()
+            cutoff_date = now - timedelta(days=days_back)
+
+            # One $facet aggregation computes every statistic server-side,
+            # so only the counts and top-20 arrays cross the wire instead of
+            # every matching document
+            pipeline = [
+                {"$match": {"scraped_at": {"$gte": cutoff_date}}},
+                {
+                    "$facet": {
+                        "total": [{"$count": "n"}],
+                        "companies": [{"$group": {"_id": "$company"}}, {"$count": "n"}],
+                        "locations": [{"$group": {"_id": "$location"}}, {"$count": "n"}],
+                        "keywords": [{"$group": {"_id": "$search_keywords"}}],
+                        "skill_totals": [{"$unwind": "$skills"}, {"$count": "n"}],
+                        "unique_skills": [
+                            {"$unwind": "$skills"},
+                            {"$group": {"_id": "$skills"}},
+                            {"$count": "n"},
+                        ],
+                        "top_skills": [
+                            {"$unwind": "$skills"},
+                            {"$sortByCount": "$skills"},
+                            {"$limit": 20},
+                        ],
+                        "top_companies": [
+                            {"$group": {"_id": "$company"}},
+                            {"$sort": {"_id": 1}},
+                            {"$limit": 20},
+                        ],
+                        "top_locations": [
+                            {"$group": {"_id": "$location"}},
+                            {"$sort": {"_id": 1}},
+                            {"$limit": 20},
+                        ],
+                    }
+                },
+            ]
+
+            facets = (await JobPosting.aggregate(pipeline).to_list())[0]
+
+            def facet_count(rows: List[Dict[str, Any]]) -> int:
+                return rows[0]["n"] if rows else 0
+
+            total_jobs = facet_count(facets["total"])
             statistics = {
                 'total_jobs': total_jobs,
-                'unique_companies': len(companies),
-                'unique_locations': len(locations),
-                'unique_search_keywords': len(search_keywords),
-                'total_skills_extracted': len(all_skills),
-                'unique_skills': len(skill_counts),
-                'top_skills': top_skills,
-                'companies_list': sorted(list(companies))[:20],  # Top 20 companies
-                'locations_list': sorted(list(locations))[:20],  # Top 20 locations
-                'search_keywords_list': sorted(list(search_keywords)),
+                'unique_companies': facet_count(facets["companies"]),
+                'unique_locations': facet_count(facets["locations"]),
+                'unique_search_keywords': len(facets["keywords"]),
+                'total_skills_extracted': facet_count(facets["skill_totals"]),
+                'unique_skills': facet_count(facets["unique_skills"]),
+                'top_skills': [(row["_id"], row["count"]) for row in facets["top_skills"]],
+                'companies_list': [row["_id"] for row in facets["top_companies"]],
+                'locations_list': [row["_id"] for row in facets["top_locations"]],
+                'search_keywords_list': sorted(row["_id"] for row in facets["keywords"]),
                 'analysis_period_days': days_back,
                 'analysis_date': datetime.utcnow().isoformat()
             }
             
+            _analytics_cache[cache_key] = statistics
             logger.info(f"Generated scraping statistics for {days_back} days: {total_jobs} jobs analyzed")
             return statistics
 
@@ -369,16 +567,13 @@ class ScraperService:
         """
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
-            
-            # Count jobs to be deleted
-            jobs_to_delete = await JobPosting.find(
-                JobPosting.scraped_at < cutoff_date
-            ).count()
-            
-            # Delete old jobs
-            delete_result = await JobPosting.find(
-                JobPosting.scraped_at < cutoff_date
-            ).delete()
+
+            # Single delete_many round-trip; the driver reports the count,
+            # so the separate pre-delete count scan is unnecessary. The TTL
+            # index on scraped_at expires most documents before this runs.
+            delete_result = await JobPosting.get_motor_collection().delete_many(
+                {"scraped_at": {"$lt": cutoff_date}}
+            )
             
             logger.info(f"Cleaned up {delete_result.deleted_count} job postings older than {days_to_keep} days")
             
@@ -405,18 +600,36 @@ class ScraperService:
         Returns:
             Dict containing skill trend analysis
         """
+        cache_key = ("skill_trends", days_back)
+        cached = _analytics_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached skill trends for %s days", days_back)
+            return cached
+
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_back)
-            
-            # Get jobs with skills
-            jobs_with_skills = await JobPosting.find(
-                JobPosting.scraped_at >= cutoff_date,
-                JobPosting.skills.exists(True)
-            ).to_list()
-            
+            now = datetime.utcnow()
+            cutoff_date = now - timedelta(days=days_back)
+
+            # Count skill occurrences server-side; only the per-skill tallies
+            # and the job count come back, and the extractor then categorizes
+            # each unique skill once instead of every occurrence
+            pipeline = [
+                {"$match": {"scraped_at": {"$gte": cutoff_date}, "skills": {"$exists": True, "$ne": []}}},
+                {
+                    "$facet": {
+                        "jobs": [{"$count": "n"}],
+                        "skills": [
+                            {"$unwind": "$skills"},
+                            {"$group": {"_id": "$skills", "count": {"$sum": 1}}},
+                        ],
+                    }
+                },
+            ]
+            facets = (await JobPosting.aggregate(pipeline).to_list())[0]
+            jobs_analyzed = facets["jobs"][0]["n"] if facets["jobs"] else 0
+            skill_counts = {row["_id"]: row["count"] for row in facets["skills"]}
+
             # Analyze skill frequencies by category
-            from app.services.skill_extractor import skill_extractor
-            
             skill_categories = {
                 'programming_languages': [],
                 'frameworks_libraries': [],
@@ -427,30 +640,25 @@ class ScraperService:
                 'other': []
             }
             
-            all_skills = []
-            for job in jobs_with_skills:
-                all_skills.extend(job.skills)
-            
             # Categorize skills
-            categorized_skills = skill_extractor.get_skill_categories(all_skills)
+            categorized_skills = _get_skill_extractor().get_skill_categories(list(skill_counts))
             
-            # Count frequencies in each category
             for category, skills in categorized_skills.items():
-                skill_counts = {}
-                for skill in skills:
-                    skill_counts[skill] = skill_counts.get(skill, 0) + 1
-                
-                # Get top skills in category
-                top_skills = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-                skill_categories[category] = top_skills
+                skill_categories[category] = heapq.nlargest(
+                    10,
+                    ((skill, skill_counts[skill]) for skill in set(skills)),
+                    key=lambda item: item[1],
+                )
             
-            return {
+            trends = {
                 'analysis_period_days': days_back,
-                'total_jobs_analyzed': len(jobs_with_skills),
-                'total_skills_found': len(all_skills),
+                'total_jobs_analyzed': jobs_analyzed,
+                'total_skills_found': sum(skill_counts.values()),
                 'skill_categories': skill_categories,
-                'analysis_date': datetime.utcnow().isoformat()
+                'analysis_date': now.isoformat()
             }
+            _analytics_cache[cache_key] = trends
+            return trends
             
         except Exception as e:
             logger.error(f"Error analyzing skill trends: {e}")
@@ -1,9 +1,11 @@
 import asyncio
 import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Optional
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import orjson
 
 from app.core.config import settings
 
@@ -40,16 +42,31 @@ class TheirStackClient:
         self._lock = asyncio.Lock()
 
     async def _get_client(self) -> httpx.AsyncClient:
+        # Fast path: once the client exists, skip the lock entirely so
+        # concurrent page fetches don't serialize on an acquire/release
+        if self._client is not None:
+            return self._client
+
         async with self._lock:
+            # Re-check under the lock; another coroutine may have won the race
             if self._client is None:
                 headers = {
                     "Authorization": f"Bearer {self._api_key}",
                     "Accept": "application/json",
                 }
+                # One pooled client for the process: keep-alive (and HTTP/2
+                # multiplexing) amortizes the TLS handshake across every
+                # page of a collection run instead of paying it per request
                 self._client = httpx.AsyncClient(
                     base_url=self._base_url,
-                    timeout=self._timeout,
+                    timeout=httpx.Timeout(self._timeout, connect=5.0),
                     headers=headers,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=64,
+                        max_keepalive_connections=32,
+                        keepalive_expiry=30.0,
+                    ),
                 )
             return self._client
 
@@ -72,43 +89,77 @@ class TheirStackClient:
                 "Payload must include one of posted_at_max_age_days or posted_at_gte/lte"
             )
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(settings.their_stack_max_retries),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(TheirStackRetryableError),
-    )
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff delay for the given (1-based) attempt."""
+        return min(10.0, max(1.0, 2.0 ** (attempt - 1)))
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header as either seconds or an HTTP-date."""
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
     async def _post_with_retry(self, endpoint: str, json: Dict[str, Any]) -> httpx.Response:
         client = await self._get_client()
-        try:
-            response = await client.post(endpoint, json=json)
-        except httpx.RequestError as exc:  # Network related errors
-            logger.warning("TheirStack request error: %s", exc)
-            raise TheirStackRetryableError(str(exc)) from exc
-
-        if response.status_code in {401, 403}:
-            logger.warning("TheirStack authentication issue (status %s)", response.status_code)
-            raise TheirStackAuthenticationError(response.text)
-
-        if response.status_code in {429} or 500 <= response.status_code < 600:
-            logger.warning(
-                "TheirStack API returned retryable status %s: %s",
-                response.status_code,
-                response.text,
-            )
-            raise TheirStackRetryableError(response.text)
 
-        if 400 <= response.status_code < 500:
-            logger.error(
-                "TheirStack API returned client error %s: %s",
-                response.status_code,
-                response.text,
-            )
-            raise TheirStackClientError(
-                f"Client error {response.status_code}: {response.text}"
-            )
+        for attempt in range(1, self._max_retries + 1):
+            try:
+                response = await client.post(endpoint, json=json)
+            except httpx.RequestError as exc:  # Network related errors
+                logger.warning("TheirStack request error: %s", exc)
+                if attempt == self._max_retries:
+                    raise TheirStackRetryableError(str(exc)) from exc
+                await asyncio.sleep(self._backoff_delay(attempt))
+                continue
+
+            if response.status_code in {401, 403}:
+                logger.warning("TheirStack authentication issue (status %s)", response.status_code)
+                raise TheirStackAuthenticationError(response.text)
+
+            if response.status_code == 429 or 500 <= response.status_code < 600:
+                logger.warning(
+                    "TheirStack API returned retryable status %s: %s",
+                    response.status_code,
+                    response.text,
+                )
+                if attempt == self._max_retries:
+                    raise TheirStackRetryableError(response.text)
+                # Prefer the server-provided wait when rate limited; fall
+                # back to exponential backoff when the header is absent
+                delay = self._parse_retry_after(response.headers.get("Retry-After"))
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                await asyncio.sleep(delay)
+                continue
+
+            if 400 <= response.status_code < 500:
+                logger.error(
+                    "TheirStack API returned client error %s: %s",
+                    response.status_code,
+                    response.text,
+                )
+                raise TheirStackClientError(
+                    f"Client error {response.status_code}: {response.text}"
+                )
+
+            return response
 
-        return response
+        raise TheirStackRetryableError("TheirStack request retries exhausted")
 
     async def search_jobs(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Search for jobs using TheirStack's job search endpoint."""
@@ -132,8 +183,10 @@ class TheirStackClient:
             raise
 
         try:
-            data = response.json()
-        except ValueError as exc:
+            # orjson decodes the raw bytes in native code, noticeably faster
+            # than response.json() on large search payloads
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
             logger.error("Invalid JSON response from TheirStack: %s", exc)
             raise TheirStackClientError("Invalid JSON response from TheirStack") from exc
 
@@ -2,9 +2,10 @@ import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List
+
 from app.models.user import User
 from app.models.job_posting import JobPosting
-from app.services.job_collection_service import JobCollectionService
+from app.services.job_collection_service import JobCollectionService, canonicalize_role
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,9 @@ class UserJobCollectionService:
 
     def __init__(self, collection_service: JobCollectionService = None):
         self.collection_service = collection_service or JobCollectionService()
+        # Role -> moment its data stops counting as fresh; lets scheduled
+        # re-runs skip the freshness query entirely inside that window
+        self._fresh_until: Dict[str, datetime] = {}
 
     async def collect_jobs_for_all_users(
         self,
@@ -36,21 +40,29 @@ class UserJobCollectionService:
         Returns:
             Dictionary with collection summary per role
         """
-        # Get all unique target roles from all users
-        all_users = await User.find_all().to_list()
-        
-        unique_roles = set()
-        for user in all_users:
-            if user.target_roles:
-                unique_roles.update(user.target_roles)
-        
-        if not unique_roles:
+        # Union the target roles server-side: only the distinct role strings
+        # cross the wire instead of one projected document per user. The
+        # user count for the log line runs concurrently
+        pipeline = [
+            {"$match": {"target_roles": {"$exists": True, "$ne": []}}},
+            {"$unwind": "$target_roles"},
+            {"$group": {"_id": "$target_roles"}},
+        ]
+        role_rows, users_with_roles = await asyncio.gather(
+            User.aggregate(pipeline).to_list(),
+            User.find({"target_roles": {"$exists": True, "$ne": []}}).count(),
+        )
+
+        # Canonicalize before deduping so near-duplicates across users
+        # ("Software Engineer" vs "software  engineer") collapse into one
+        # API fetch and one freshness key
+        roles_list = sorted({canonicalize_role(row["_id"]) for row in role_rows})
+        if not roles_list:
             logger.warning("No target roles found across all users")
             return {}
-        
-        roles_list = sorted(list(unique_roles))
+
         logger.info(
-            f"Found {len(roles_list)} unique roles from {len(all_users)} users: {roles_list}"
+            f"Found {len(roles_list)} unique roles from {users_with_roles} users: {roles_list}"
         )
         
         # Filter out roles that already have fresh data
@@ -143,26 +155,53 @@ class UserJobCollectionService:
         Returns:
             List of roles that need new data
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=freshness_days)
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=freshness_days)
+
+        # Roles whose cached freshness deadline hasn't passed need no query
+        roles_to_probe = [
+            role for role in roles
+            if self._fresh_until.get(role, datetime.min) <= now
+        ]
+
+        # One aggregation answers freshness for every probed role at once
+        # instead of a find_one round-trip per role
+        fresh_roles: Dict[str, datetime] = {}
+        if roles_to_probe:
+            pipeline = [
+                {
+                    "$match": {
+                        "search_keywords": {"$in": roles_to_probe},
+                        "scraped_at": {"$gte": cutoff_date},
+                    }
+                },
+                {"$group": {"_id": "$search_keywords", "last_scraped": {"$max": "$scraped_at"}}},
+            ]
+            fresh_roles = {
+                row["_id"]: row["last_scraped"]
+                for row in await JobPosting.aggregate(pipeline).to_list()
+            }
+            for fresh_role, last_scraped in fresh_roles.items():
+                self._fresh_until[fresh_role] = last_scraped + timedelta(days=freshness_days)
+
+        probed = set(roles_to_probe)
         roles_needing_update = []
-        
         for role in roles:
-            # Check if we have recent jobs for this role
-            recent_job = await JobPosting.find_one(
-                {
-                    "search_keywords": role,
-                    "scraped_at": {"$gte": cutoff_date}
-                }
-            )
-            
-            if recent_job:
+            if role not in probed:
                 logger.info(
-                    f"Role '{role}' has fresh data (last scraped: {recent_job.scraped_at}). Skipping."
+                    f"Role '{role}' known fresh until {self._fresh_until[role]}. Skipping."
+                )
+                continue
+
+            last_scraped = fresh_roles.get(role)
+            if last_scraped:
+                logger.info(
+                    f"Role '{role}' has fresh data (last scraped: {last_scraped}). Skipping."
                 )
             else:
                 logger.info(
                     f"Role '{role}' needs update (no data newer than {freshness_days} days)."
                 )
                 roles_needing_update.append(role)
-        
+
         return roles_needing_update
@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from motor.motor_asyncio import AsyncIOMotorClient
 from beanie import init_beanie
 import os
@@ -9,10 +10,16 @@ sys.path.append(os.getcwd())
 
 from app.models.user import User
 from app.models.job_posting import JobPosting
-from app.services.job_collection_service import JobCollectionService
+from app.services.job_collection_service import JobCollectionService, canonicalize_role
 from app.services.user_job_collection_service import UserJobCollectionService
 from app.core.config import settings
 
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
 async def main():
     client = None
     try:
@@ -23,53 +30,56 @@ async def main():
         
         # Get all users with target roles
         users = await User.find({"target_roles": {"$exists": True, "$ne": []}}).to_list()
-        print(f"🎯 Found {len(users)} users with target roles")
-        
+        logger.info(f"🎯 Found {len(users)} users with target roles")
+
         if not users:
-            print("No users with target roles found")
+            logger.warning("No users with target roles found")
             return
 
         # Initialize services
         collection_service = JobCollectionService()
         user_collection_service = UserJobCollectionService(collection_service)
         
-        total_collected = 0
-        
+        # Collect once per unique role across all users instead of once per
+        # user: shared roles like "Software Engineer" hit the upstream API
+        # a single time no matter how many users target them
+        summary = await user_collection_service.collect_jobs_for_all_users(
+            max_age_days=14,
+            jobs_per_role=5
+        )
+
+        total_collected = sum(stats.get('jobs_collected', 0) for stats in summary.values())
+
+        # Build the per-user report after collection finishes and emit it
+        # in one shot, rather than interleaving output with the work
+        report_lines = []
         for user in users:
-            try:
-                print(f"\n👤 Processing user: {user.email}")
-                print(f"   🎯 Target roles: {', '.join(user.target_roles) if user.target_roles else 'None'}")
-                
-                # Collect jobs
-                summary = await user_collection_service.collect_jobs_for_user(
-                    user_id=str(user.id),
-                    max_age_days=14,
-                    jobs_per_role=5
-                )
-                
-                if summary:
-                    user_total = sum(role_stats.get('jobs_collected', 0) for role_stats in summary.values())
-                    total_collected += user_total
-                    print(f"   ✅ Collected {user_total} jobs:")
-                    for role, stats in summary.items():
-                        print(f"      • {role}: {stats.get('jobs_collected', 0)} jobs")
-                else:
-                    print("   ℹ️ No new jobs found or all roles have fresh data")
-            
-            except Exception as e:
-                print(f"   ❌ Error processing user {user.email}: {str(e)}")
-                continue
-        
-        print(f"\n✨ Job collection complete! Total jobs collected: {total_collected}")
-                
+            report_lines.append(f"👤 User: {user.email}")
+            report_lines.append(f"   🎯 Target roles: {', '.join(user.target_roles) if user.target_roles else 'None'}")
+
+            # Summary keys are canonical role strings, so canonicalize the
+            # user's roles (deduping near-duplicates) before looking them up
+            user_roles = {canonicalize_role(role) for role in (user.target_roles or [])}
+            collected_roles = sorted(role for role in user_roles if role in summary)
+            if collected_roles:
+                user_total = sum(summary[role].get('jobs_collected', 0) for role in collected_roles)
+                report_lines.append(f"   ✅ {user_total} new jobs across this user's roles:")
+                for role in collected_roles:
+                    report_lines.append(f"      • {role}: {summary[role].get('jobs_collected', 0)} jobs")
+            else:
+                report_lines.append("   ℹ️ No new jobs found or all roles have fresh data")
+
+        logger.info("\n".join(report_lines))
+        logger.info(f"✨ Job collection complete! Total jobs collected: {total_collected}")
+
     except Exception as e:
-        print(f"\n❌ Fatal error: {str(e)}")
+        logger.error(f"❌ Fatal error: {str(e)}")
         raise
     finally:
         if client:
             client.close()  # Close without await for sync client
-            print("Database connection closed")
+            logger.info("Database connection closed")
 
 if __name__ == "__main__":
-    print("🚀 Starting job collection for ALL users...")
+    logger.info("🚀 Starting job collection for ALL users...")
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""Canonicalize search_keywords on existing job postings.
+
+Job collection now writes `search_keywords` in canonical form (lowercase,
+whitespace-collapsed) so the per-role freshness lookup hits a single index
+key per role. This one-shot migration brings historical documents in line.
+
+Usage:
+    python -m scripts.canonicalize_search_keywords
+
+The script will:
+1. Connect to MongoDB using the standard app configuration.
+2. Find every distinct `search_keywords` value that differs from its
+   canonical form.
+3. Rewrite those documents with one update_many per distinct value.
+4. Backfill `search_keywords_lc` and `location_lc` on documents ingested
+   before those fields existed.
+5. Report the number of jobs updated.
+"""
+
+import asyncio
+import logging
+
+from app.core.database import connect_to_mongo
+from app.models.job_posting import JobPosting
+from app.services.job_collection_service import canonicalize_role
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+async def canonicalize_search_keywords():
+    """Rewrite non-canonical search_keywords values in place."""
+    logger.info("Starting search_keywords canonicalization...")
+
+    # One update_many per distinct legacy value, not one write per document
+    pipeline = [
+        {"$match": {"search_keywords": {"$type": "string"}}},
+        {"$group": {"_id": "$search_keywords"}},
+    ]
+    rows = await JobPosting.aggregate(pipeline).to_list()
+
+    collection = JobPosting.get_motor_collection()
+    updated = 0
+    for row in rows:
+        raw = row["_id"]
+        canonical = canonicalize_role(raw)
+        if raw == canonical:
+            continue
+
+        result = await collection.update_many(
+            {"search_keywords": raw},
+            {"$set": {"search_keywords": canonical, "search_keywords_lc": canonical}},
+        )
+        if result.modified_count:
+            logger.info(
+                "Rewrote %d jobs from %r to %r",
+                result.modified_count, raw, canonical,
+            )
+        updated += result.modified_count
+
+    if updated == 0:
+        logger.info("All search_keywords values are already canonical. Nothing to do.")
+        return
+
+    logger.info("Canonicalization complete")
+    logger.info("Jobs updated: %d", updated)
+
+
+async def backfill_search_keywords_lc():
+    """Populate search_keywords_lc where canonicalization never touched it."""
+    logger.info("Backfilling search_keywords_lc...")
+
+    # The rewrite loop skips documents whose search_keywords is already
+    # canonical, so legacy postings with an already-lowercase role string
+    # never get search_keywords_lc and stay invisible to the keyword
+    # prefix filter. After the loop every search_keywords value is
+    # canonical, so the missing field is a straight copy
+    collection = JobPosting.get_motor_collection()
+    result = await collection.update_many(
+        {"search_keywords_lc": None, "search_keywords": {"$type": "string"}},
+        [{"$set": {"search_keywords_lc": "$search_keywords"}}],
+    )
+
+    if result.modified_count:
+        logger.info("Backfilled search_keywords_lc on %d jobs", result.modified_count)
+    else:
+        logger.info("All jobs already carry search_keywords_lc. Nothing to do.")
+
+
+async def backfill_location_lc():
+    """Populate location_lc on documents ingested before the field existed."""
+    logger.info("Backfilling location_lc...")
+
+    # location_lc is only written on new ingests; location-filtered queries
+    # would silently exclude legacy postings without this backfill. A single
+    # pipeline update lets Mongo derive the value server-side
+    collection = JobPosting.get_motor_collection()
+    result = await collection.update_many(
+        {"location_lc": None, "location": {"$type": "string"}},
+        [{"$set": {"location_lc": {"$toLower": "$location"}}}],
+    )
+
+    if result.modified_count:
+        logger.info("Backfilled location_lc on %d jobs", result.modified_count)
+    else:
+        logger.info("All jobs already carry location_lc. Nothing to do.")
+
+
+async def main():
+    await connect_to_mongo()
+    logger.info("Connected to MongoDB")
+
+    await canonicalize_search_keywords()
+    await backfill_search_keywords_lc()
+    await backfill_location_lc()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -35,58 +35,58 @@ async def clean_skills_data():
     logger.info("Starting skills data cleanup migration...")
     
     try:
-        # Initialize database connection
-        await connect_to_mongo()
-        logger.info("Database connection established")
-        
-        # Find all jobs with technology_slugs
-        jobs_with_tech_slugs = await JobPosting.find(
-            {"technology_slugs": {"$exists": True, "$ne": []}}
-        ).to_list()
-        
-        total_jobs = len(jobs_with_tech_slugs)
-        logger.info(f"Found {total_jobs} jobs with technology_slugs to process")
-        
+        # Bucket jobs by their exact technology_slugs combination: the
+        # slug-to-skills mapping is deterministic, so each distinct
+        # combination only needs to be mapped once and written back with a
+        # single update_many, instead of mapping and updating per document
+        pipeline = [
+            {"$match": {"technology_slugs": {"$exists": True, "$ne": []}}},
+            {
+                "$group": {
+                    "_id": "$technology_slugs",
+                    "ids": {"$addToSet": "$_id"},
+                    "skill_variants": {"$addToSet": "$skills"},
+                }
+            },
+        ]
+        buckets = await JobPosting.aggregate(pipeline).to_list()
+
+        total_jobs = sum(len(bucket["ids"]) for bucket in buckets)
+        logger.info(
+            f"Found {total_jobs} jobs across {len(buckets)} distinct technology_slug sets"
+        )
+
         if total_jobs == 0:
             logger.warning("No jobs found with technology_slugs field")
             return
-        
+
         updated_count = 0
         skipped_count = 0
         error_count = 0
-        
-        for idx, job in enumerate(jobs_with_tech_slugs, 1):
+        collection = JobPosting.get_motor_collection()
+
+        for bucket in buckets:
+            slugs = bucket["_id"]
+            ids = bucket["ids"]
             try:
-                # Map technology slugs to clean skills
-                old_skills_count = len(job.skills) if job.skills else 0
-                clean_skills = skill_extractor.map_technology_slugs(job.technology_slugs)
-                new_skills_count = len(clean_skills)
-                
-                # Only update if there's a change
-                if set(clean_skills) != set(job.skills or []):
-                    job.skills = clean_skills
-                    job.updated_at = datetime.now(UTC)
-                    await job.save()
-                    updated_count += 1
-                    
-                    if idx % 100 == 0:
-                        logger.info(
-                            f"Progress: {idx}/{total_jobs} processed "
-                            f"({updated_count} updated, {skipped_count} skipped, {error_count} errors)"
-                        )
-                    
-                    # Log significant changes
-                    if old_skills_count > new_skills_count * 2:
-                        logger.debug(
-                            f"Job {job.job_id or job.url}: "
-                            f"Reduced skills from {old_skills_count} to {new_skills_count}"
-                        )
-                else:
-                    skipped_count += 1
-                    
+                clean_skills = skill_extractor.map_technology_slugs(slugs)
+                clean_set = set(clean_skills)
+
+                # Skip the whole bucket when every document already holds
+                # exactly the mapped skills; idempotent re-runs become free
+                if all(set(variant or []) == clean_set for variant in bucket["skill_variants"]):
+                    skipped_count += len(ids)
+                    continue
+
+                result = await collection.update_many(
+                    {"_id": {"$in": ids}, "skills": {"$ne": clean_skills}},
+                    {"$set": {"skills": clean_skills, "updated_at": datetime.now(UTC)}},
+                )
+                updated_count += result.modified_count
+                skipped_count += len(ids) - result.modified_count
             except Exception as e:
-                error_count += 1
-                logger.error(f"Error updating job {job.job_id or job.url}: {str(e)}")
+                error_count += len(ids)
+                logger.error(f"Error updating jobs with slugs {slugs}: {str(e)}")
         
         # Summary
         logger.info("=" * 60)
@@ -120,31 +120,37 @@ async def verify_cleanup():
     logger.info("=" * 60)
     
     try:
-        await connect_to_mongo()
-        
-        # Count total jobs
-        total_jobs = await JobPosting.find_all().count()
-        logger.info(f"Total jobs in database: {total_jobs}")
-        
-        # Count jobs with technology_slugs
-        jobs_with_tech = await JobPosting.find(
-            {"technology_slugs": {"$exists": True, "$ne": []}}
-        ).count()
-        logger.info(f"Jobs with technology_slugs: {jobs_with_tech}")
-        
-        # Check for jobs with large skills arrays (potential issues)
+        # One $facet computes all three report queries in a single pass
         pipeline = [
-            {"$project": {
-                "title": 1,
-                "company": 1,
-                "skills_count": {"$size": {"$ifNull": ["$skills", []]}},
-                "tech_slugs_count": {"$size": {"$ifNull": ["$technology_slugs", []]}}
-            }},
-            {"$match": {"skills_count": {"$gt": 50}}},
-            {"$limit": 5}
+            {"$facet": {
+                "total": [{"$count": "n"}],
+                "with_tech": [
+                    {"$match": {"technology_slugs": {"$exists": True, "$ne": []}}},
+                    {"$count": "n"},
+                ],
+                "many_skills": [
+                    {"$project": {
+                        "title": 1,
+                        "company": 1,
+                        "skills_count": {"$size": {"$ifNull": ["$skills", []]}},
+                        "tech_slugs_count": {"$size": {"$ifNull": ["$technology_slugs", []]}}
+                    }},
+                    {"$match": {"skills_count": {"$gt": 50}}},
+                    {"$limit": 5},
+                ],
+            }}
         ]
-        
-        jobs_with_many_skills = await JobPosting.aggregate(pipeline).to_list()
+
+        facets = (await JobPosting.aggregate(pipeline).to_list())[0]
+
+        def facet_count(name: str) -> int:
+            rows = facets.get(name) or []
+            return rows[0]["n"] if rows else 0
+
+        logger.info(f"Total jobs in database: {facet_count('total')}")
+        logger.info(f"Jobs with technology_slugs: {facet_count('with_tech')}")
+
+        jobs_with_many_skills = facets.get("many_skills") or []
         
         if jobs_with_many_skills:
             logger.warning(f"\nFound {len(jobs_with_many_skills)} jobs with >50 skills (may need attention):")
@@ -177,6 +183,10 @@ async def main():
     logger.info("=" * 60)
     
     try:
+        # One connection shared by both steps
+        await connect_to_mongo()
+        logger.info("Database connection established")
+
         # Step 1: Clean the data
         await clean_skills_data()
         
@@ -41,36 +41,28 @@ async def migrate_experience_levels():
     """Update existing users to the new experience level taxonomy."""
     logger.info("Starting experience level migration...")
 
-    await connect_to_mongo()
-    logger.info("Connected to MongoDB")
-
-    legacy_levels = list(EXPERIENCE_LEVEL_MAP.keys())
+    # One update_many per legacy label: five writes total, regardless of
+    # how many users need migrating
+    collection = User.get_motor_collection()
 
-    users_to_update = await User.find({
-        "experience_level": {"$in": legacy_levels}
-    }).to_list()
-
-    total = len(users_to_update)
-    if total == 0:
+    updated = 0
+    for old_level, new_level in EXPERIENCE_LEVEL_MAP.items():
+        result = await collection.update_many(
+            {"experience_level": old_level},
+            {"$set": {"experience_level": new_level}},
+        )
+        if result.modified_count:
+            logger.info(
+                "Updated %d users from %s to %s",
+                result.modified_count, old_level, new_level,
+            )
+        updated += result.modified_count
+
+    if updated == 0:
         logger.info("No users found with legacy experience levels. Nothing to do.")
         return
 
-    logger.info("Found %d users with legacy experience levels", total)
-
-    updated = 0
-    for user in users_to_update:
-        old_level = user.experience_level
-        new_level = EXPERIENCE_LEVEL_MAP.get(old_level)
-        if not new_level:
-            continue
-
-        user.experience_level = new_level
-        await user.save()
-        updated += 1
-        logger.debug("Updated %s from %s to %s", user.email, old_level, new_level)
-
     logger.info("Experience level migration complete")
-    logger.info("Total users processed: %d", total)
     logger.info("Users updated: %d", updated)
 
 
@@ -78,15 +70,23 @@ async def verify_results():
     """Provide a quick summary of the new distribution."""
     logger.info("\nVerifying experience level distribution...")
 
-    counts = {}
-    for new_level in EXPERIENCE_LEVEL_MAP.values():
-        counts[new_level] = await User.find({"experience_level": new_level}).count()
+    # Count every level in one aggregation instead of one count() per label
+    pipeline = [
+        {"$match": {"experience_level": {"$in": list(EXPERIENCE_LEVEL_MAP.values())}}},
+        {"$group": {"_id": "$experience_level", "count": {"$sum": 1}}},
+    ]
+    rows = await User.aggregate(pipeline).to_list()
+    counts = {row["_id"]: row["count"] for row in rows}
 
-    for level, count in counts.items():
-        logger.info("%s: %d", level, count)
+    for level in EXPERIENCE_LEVEL_MAP.values():
+        logger.info("%s: %d", level, counts.get(level, 0))
 
 
 async def main():
+    # One connection shared by both steps
+    await connect_to_mongo()
+    logger.info("Connected to MongoDB")
+
     await migrate_experience_levels()
     await verify_results()
 
@@ -0,0 +1,98 @@
+"""Reconcile the scraped_at TTL index on job_postings.
+
+The JobPosting model declares a TTL index on `scraped_at` so Mongo expires
+postings past the retention window. Deployments created before that change
+already carry a plain `scraped_at_1` index, and Mongo rejects an index spec
+whose keys match an existing index but whose options differ
+(IndexOptionsConflict), which would crash Beanie's index init on startup.
+
+Run this script before deploying the TTL change, and again whenever
+`job_data_retention_days` is changed. It connects with raw Motor rather
+than through Beanie, because Beanie's own init would trip over the very
+conflict this script resolves.
+
+Usage:
+    python -m scripts.migrate_scraped_at_ttl
+
+The script will:
+1. Connect to MongoDB using the standard app configuration.
+2. Inspect the existing `scraped_at_1` index.
+3. Drop a plain (non-TTL) index so the TTL version can be created, or
+   collMod an existing TTL index whose expiry differs from the setting.
+4. Create the TTL index if it is missing.
+"""
+
+import asyncio
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING
+
+from app.core.config import settings
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "scraped_at_1"
+
+
+async def migrate_scraped_at_ttl(collection):
+    """Bring the scraped_at index in line with the configured retention."""
+    expire_after = settings.job_data_retention_days * 86400
+    logger.info(
+        "Reconciling %s with expireAfterSeconds=%d...", INDEX_NAME, expire_after
+    )
+
+    indexes = await collection.index_information()
+    existing = indexes.get(INDEX_NAME)
+
+    if existing is None:
+        await collection.create_index(
+            [("scraped_at", ASCENDING)], expireAfterSeconds=expire_after
+        )
+        logger.info("Created TTL index %s", INDEX_NAME)
+        return
+
+    current_expiry = existing.get("expireAfterSeconds")
+    if current_expiry == expire_after:
+        logger.info("Index %s already matches. Nothing to do.", INDEX_NAME)
+        return
+
+    if current_expiry is None:
+        # collMod cannot convert a plain index into a TTL index, so the old
+        # index has to be dropped and recreated
+        await collection.drop_index(INDEX_NAME)
+        await collection.create_index(
+            [("scraped_at", ASCENDING)], expireAfterSeconds=expire_after
+        )
+        logger.info("Replaced plain index %s with TTL index", INDEX_NAME)
+        return
+
+    # Retention setting changed: adjust the expiry in place
+    await collection.database.command(
+        "collMod",
+        collection.name,
+        index={"name": INDEX_NAME, "expireAfterSeconds": expire_after},
+    )
+    logger.info(
+        "Updated %s expiry from %d to %d seconds",
+        INDEX_NAME, current_expiry, expire_after,
+    )
+
+
+async def main():
+    client = AsyncIOMotorClient(settings.mongodb_uri)
+    try:
+        database = client.get_default_database()
+        logger.info("Connected to MongoDB")
+
+        await migrate_scraped_at_ttl(database["job_postings"])
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())